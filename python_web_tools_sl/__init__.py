@@ -1,19 +1,39 @@
 from .soup_helpers import (
+    DEFAULT_HEADERS,
     aextract_form_from_url,
     amake_soup,
+    amake_soups,
+    amake_tree,
+    close_default_session,
+    close_playwright,
+    close_session,
     extract_form,
     extract_form_from_url,
     extract_name_value_pairs,
+    extract_name_value_pairs_fast,
+    install_uvloop,
     make_soup,
+    make_tree,
     soup_from_text,
+    tree_from_text,
 )
 
 __all__ = [
     "make_soup",
     "amake_soup",
+    "amake_soups",
     "soup_from_text",
+    "make_tree",
+    "amake_tree",
+    "tree_from_text",
     "extract_name_value_pairs",
+    "extract_name_value_pairs_fast",
     "extract_form",
     "extract_form_from_url",
     "aextract_form_from_url",
+    "close_session",
+    "close_default_session",
+    "close_playwright",
+    "install_uvloop",
+    "DEFAULT_HEADERS",
 ]
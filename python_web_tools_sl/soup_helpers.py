@@ -1,22 +1,49 @@
 """File for some tools."""
 
+from __future__ import annotations
+
+import asyncio
+import atexit
+import codecs
+import concurrent.futures
+import contextlib
+import functools
+import importlib.util
 import logging
+import os
+import queue
+import re
+import threading
+import time
+import urllib.parse
 import warnings
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, Union  # noqa: F401
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final, List, Optional, Tuple, Union  # noqa: F401
 
-import aiohttp
 import requests
-from bs4 import BeautifulSoup, Tag
-
-from requests_html import AsyncHTMLSession, HTMLResponse
-
+import urllib3.util.request
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+from bs4.builder import TreeBuilder, builder_registry
+from bs4.dammit import EncodingDetector
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# aiohttp et requests_html sont importés à la demande : importer ce module
+# (ex. juste pour soup_from_text) ne charge ni asyncio/SSL d'aiohttp ni pyppeteer
 if TYPE_CHECKING:
-    from requests_html import HTMLSession
-else:
-    try:
-        from requests_html import HTMLSession
-    except ImportError:
-        HTMLSession = None
+    import aiohttp
+    import httpx
+    from lxml.etree import XPath
+    from lxml.html import HtmlElement
+    from playwright.async_api import Page as AsyncPage
+    from playwright.sync_api import Page
+    from requests_html import AsyncHTMLSession, HTMLSession
+
+_HAS_REQUESTS_HTML = importlib.util.find_spec("requests_html") is not None
+_HAS_SELECTOLAX = importlib.util.find_spec("selectolax") is not None
+_HAS_AIODNS = importlib.util.find_spec("aiodns") is not None
 
 
 def get_playwright():
@@ -41,23 +68,1061 @@ def get_async_playwright():
         )
 
 
+def get_selectolax() -> Any:
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+
+        return LexborHTMLParser
+    except ImportError:
+        raise RuntimeError(
+            "selectolax n'est pas installé. "
+            "Installe-le avec : pip install python-web-tools[selectolax]"
+        )
+
+
+def get_requests_cache() -> Any:
+    try:
+        import requests_cache
+
+        return requests_cache
+    except ImportError:
+        raise RuntimeError(
+            "requests-cache n'est pas installé. "
+            "Installe-le avec : pip install python-web-tools[cache]"
+        )
+
+
+def get_aiohttp_client_cache() -> Any:
+    try:
+        import aiohttp_client_cache
+
+        return aiohttp_client_cache
+    except ImportError:
+        raise RuntimeError(
+            "aiohttp-client-cache n'est pas installé. "
+            "Installe-le avec : pip install python-web-tools[cache]"
+        )
+
+
+# lxml (C) si disponible ; find_spec évite d'importer lxml au chargement du module
+_DEFAULT_PARSER = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
+
 TimeoutType = Union[int, float, None]
 
+# TreeBuilder déjà instanciés, par nom de parser (un jeu par thread : un builder
+# garde un état pendant le parsing)
+_BUILDERS = threading.local()
+
+# parsers lxml déjà instanciés, par encodage (un jeu par thread : lxml interdit
+# d'utiliser le même parser dans deux threads à la fois)
+_LXML_PARSERS = threading.local()
+
 logger = logging.getLogger(__name__)
 
-headers = {
-    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_10_1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/39.0.2171.95 Safari/537.36"  # noqa: E501
-}  # noqa:E501
+# brotli n'est annoncé que si un décodeur est installé (requests et aiohttp l'utilisent alors)
+_ACCEPT_ENCODING = (
+    "gzip, deflate, br"
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi")
+    else "gzip, deflate"
+)
+
+# en-têtes par défaut des sessions partagées (sync et async), en lecture seule :
+# une seule instance au niveau du module, qu'aucun appelant ne peut modifier
+DEFAULT_HEADERS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0 Safari/537.36"
+        ),
+        "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
+        "Accept-Encoding": _ACCEPT_ENCODING,
+    }
+)
+headers = DEFAULT_HEADERS  # ancien nom, gardé pour la compatibilité
+
+# session partagée, créée au premier appel : keep-alive + pool de connexions entre les make_soup
+_DEFAULT_SESSION: requests.Session | None = None
+_DEFAULT_SESSION_LOCK = threading.Lock()
+
+
+def _get_default_session() -> requests.Session:
+    """Return the shared requests.Session of the "requests" backend, creating it on first use."""
+    global _DEFAULT_SESSION
+    with _DEFAULT_SESSION_LOCK:
+        if _DEFAULT_SESSION is None:
+            _DEFAULT_SESSION = _setup_session(requests.Session())
+        return _DEFAULT_SESSION
+
+
+def _setup_session(session: requests.Session) -> requests.Session:
+    """Apply the shared configuration (headers, pool, retries) to a requests session."""
+    session.headers.update(DEFAULT_HEADERS)
+    # urllib3 annonce br / zstd dès que brotli / zstandard sont installés
+    # (et sait alors les décoder)
+    session.headers["Accept-Encoding"] = urllib3.util.request.ACCEPT_ENCODING
+    # 2 nouvelles tentatives de connexion : 0.3 s puis 0.6 s d'attente. Jamais sur un
+    # délai de lecture dépassé (read=False) : `timeout` reste la durée maximale et l'appelant
+    # reçoit requests.ReadTimeout, pas une ConnectionError après plusieurs essais
+    retries = Retry(total=2, read=False, backoff_factor=0.3)
+    adapter = HTTPAdapter(pool_connections=50, pool_maxsize=100, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# sessions à cache HTTP persistant (paramètre `cache`), une par fichier SQLite
+_CACHED_SESSIONS: dict[str, requests.Session] = {}
+
+
+def _get_cached_session(cache: str | os.PathLike[str]) -> requests.Session:
+    """Return the shared requests-cache session storing its responses in `cache` (SQLite)."""
+    path = os.fspath(cache)
+    with _DEFAULT_SESSION_LOCK:
+        session = _CACHED_SESSIONS.get(path)
+        if session is None:
+            session = get_requests_cache().CachedSession(
+                path, backend="sqlite", expire_after=3600, cache_control=True
+            )
+            _CACHED_SESSIONS[path] = session = _setup_session(session)
+        return session
+
+
+def close_default_session() -> None:
+    """
+    Close the shared requests sessions used by `make_soup` (backend "requests", with or
+    without `cache`).
+
+    A new one is created on the next call, so this is safe to call at any time.
+    """
+    global _DEFAULT_SESSION
+    with _DEFAULT_SESSION_LOCK:
+        if _DEFAULT_SESSION is not None:
+            _DEFAULT_SESSION.close()
+        _DEFAULT_SESSION = None
+        for session in _CACHED_SESSIONS.values():
+            session.close()
+        _CACHED_SESSIONS.clear()
+
+
+# session aiohttp partagée, créée au premier appel (liée à la boucle asyncio courante)
+_AIOHTTP_SESSION: aiohttp.ClientSession | None = None
+_AIOHTTP_SESSION_LOOP: asyncio.AbstractEventLoop | None = None
+# résolveur DNS asynchrone de la session (le connecteur ne ferme pas un résolveur fourni)
+_AIOHTTP_RESOLVER: aiohttp.AsyncResolver | None = None
+
+
+def _aiohttp_accept_encoding() -> str:
+    """Accept-Encoding listing only the codings aiohttp can decode here (br, zstd optional)."""
+    from aiohttp import compression_utils
+
+    codings = ["gzip", "deflate"]
+    if compression_utils.HAS_BROTLI:
+        codings.append("br")
+    if getattr(compression_utils, "HAS_ZSTD", False):
+        codings.append("zstd")
+    return ", ".join(codings)
+
+
+def _on_running_loop(owner: asyncio.AbstractEventLoop | None, what: str) -> bool:
+    """
+    Whether an open shared resource created on `owner` can be closed from the running loop.
+
+    If not, warn: the caller drops it without closing it (its loop is another one).
+    """
+    if owner is asyncio.get_running_loop():
+        return True
+    warnings.warn(
+        f"{what} appartient à une autre boucle asyncio : abandonnée sans être fermée "
+        "(attendre close_session() avant la fin de la boucle qui l'a créée)",
+        RuntimeWarning,
+        stacklevel=3,
+    )
+    return False
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session, creating it on first use (or on a new event loop)."""
+    import aiohttp
+
+    global _AIOHTTP_SESSION, _AIOHTTP_SESSION_LOOP, _AIOHTTP_RESOLVER
+    loop = asyncio.get_running_loop()
+    # pas d'await entre le test et la création : pas besoin de verrou
+    if _AIOHTTP_SESSION is None or _AIOHTTP_SESSION.closed or _AIOHTTP_SESSION_LOOP is not loop:
+        old_resolver = _AIOHTTP_RESOLVER
+        if _AIOHTTP_SESSION is not None and _AIOHTTP_SESSION_LOOP is not loop:
+            if not _AIOHTTP_SESSION.closed:
+                _on_running_loop(_AIOHTTP_SESSION_LOOP, "La session aiohttp partagée")
+            # résolveur de l'autre boucle : pas fermable ici non plus
+            old_resolver = None
+        # résolution DNS asynchrone (c-ares) si aiodns est installé, sinon pool de threads
+        _AIOHTTP_RESOLVER = aiohttp.AsyncResolver() if _HAS_AIODNS else None
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=600,
+            keepalive_timeout=75,
+            resolver=_AIOHTTP_RESOLVER,
+        )
+        _AIOHTTP_SESSION = aiohttp.ClientSession(
+            connector=connector,
+            headers={**DEFAULT_HEADERS, "Accept-Encoding": _aiohttp_accept_encoding()},
+            timeout=aiohttp.ClientTimeout(total=30),
+            # tampon de lecture de 4 Mo (64 Ko par défaut) : moins de lectures sur les grosses pages
+            read_bufsize=4 * 1024 * 1024,
+        )
+        _AIOHTTP_SESSION_LOOP = loop
+        if old_resolver is not None:
+            # session fermée par l'appelant dans cette boucle : son résolveur est libéré
+            await old_resolver.close()
+    return _AIOHTTP_SESSION
+
+
+# sessions aiohttp à cache HTTP persistant (paramètre `cache`), une par fichier SQLite
+_ACACHED_SESSIONS: dict[str, aiohttp.ClientSession] = {}
+_ACACHED_SESSIONS_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _get_acached_session(cache: str | os.PathLike[str]) -> aiohttp.ClientSession:
+    """Return the aiohttp-client-cache session of the running loop storing into `cache`."""
+    import aiohttp
+
+    global _ACACHED_SESSIONS_LOOP
+    loop = asyncio.get_running_loop()
+    if _ACACHED_SESSIONS_LOOP is not loop:
+        if any(not cached.closed for cached in _ACACHED_SESSIONS.values()):
+            _on_running_loop(_ACACHED_SESSIONS_LOOP, "Une session aiohttp avec cache")
+        _ACACHED_SESSIONS.clear()
+        _ACACHED_SESSIONS_LOOP = loop
+    path = os.fspath(cache)
+    session = _ACACHED_SESSIONS.get(path)
+    if session is None or session.closed:
+        client_cache = get_aiohttp_client_cache()
+        session = client_cache.CachedSession(
+            cache=client_cache.SQLiteBackend(path, expire_after=3600, cache_control=True),
+            headers={**DEFAULT_HEADERS, "Accept-Encoding": _aiohttp_accept_encoding()},
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        _ACACHED_SESSIONS[path] = session
+    return session
+
+
+# clients httpx partagés, un par valeur de `ssl` (verify est fixé à la création du client)
+_HTTPX_CLIENTS: dict[bool, httpx.AsyncClient] = {}
+_HTTPX_CLIENTS_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _get_httpx_client(ssl: bool) -> httpx.AsyncClient:
+    """Return the shared httpx.AsyncClient of the running event loop for this `ssl` setting."""
+    import httpx
+
+    global _HTTPX_CLIENTS_LOOP
+    loop = asyncio.get_running_loop()
+    if _HTTPX_CLIENTS_LOOP is not loop:
+        if any(not client.is_closed for client in _HTTPX_CLIENTS.values()):
+            _on_running_loop(_HTTPX_CLIENTS_LOOP, "Un client httpx partagé")
+        _HTTPX_CLIENTS.clear()
+        _HTTPX_CLIENTS_LOOP = loop
+    client = _HTTPX_CLIENTS.get(ssl)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            verify=ssl,
+            headers=DEFAULT_HEADERS,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=20),
+            follow_redirects=True,
+        )
+        _HTTPX_CLIENTS[ssl] = client
+    return client
+
+
+# clients httpx synchrones partagés (backend "httpx" de make_soup), un par valeur de `ssl`
+_HTTPX_SYNC_CLIENTS: dict[bool, httpx.Client] = {}
+
+
+def _get_httpx_sync_client(ssl: bool) -> httpx.Client:
+    """Return the shared httpx.Client for this `ssl` setting (thread-safe, pooled)."""
+    import httpx
+
+    client = _HTTPX_SYNC_CLIENTS.get(ssl)
+    if client is None or client.is_closed:
+        client = httpx.Client(
+            verify=ssl,
+            headers=DEFAULT_HEADERS,
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=20),
+            follow_redirects=True,
+        )
+        _HTTPX_SYNC_CLIENTS[ssl] = client
+    return client
+
+
+@atexit.register
+def _close_httpx_sync_clients() -> None:
+    """Close the shared sync httpx clients."""
+    for client in _HTTPX_SYNC_CLIENTS.values():
+        client.close()
+    _HTTPX_SYNC_CLIENTS.clear()
+
+
+# sessions requests_html partagées : le Chromium de render() est lancé une seule fois
+_HTML_SESSION: HTMLSession | None = None
+_ARENDER_SESSION: AsyncHTMLSession | None = None
+_ARENDER_SESSION_LOOP: asyncio.AbstractEventLoop | None = None
+
+
+def _get_html_session() -> HTMLSession:
+    """Return the shared HTMLSession (its Chromium is reused by every `render()`)."""
+    from requests_html import HTMLSession
+
+    global _HTML_SESSION
+    if _HTML_SESSION is None:
+        _HTML_SESSION = HTMLSession()
+        atexit.register(_HTML_SESSION.close)
+    return _HTML_SESSION
+
+
+def _get_arender_session() -> AsyncHTMLSession:
+    """Return the shared AsyncHTMLSession of the running event loop."""
+    from requests_html import AsyncHTMLSession
+
+    global _ARENDER_SESSION, _ARENDER_SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _ARENDER_SESSION is None or _ARENDER_SESSION_LOOP is not loop:
+        if _ARENDER_SESSION is not None:
+            _on_running_loop(_ARENDER_SESSION_LOOP, "La session requests_html partagée")
+        _ARENDER_SESSION = AsyncHTMLSession(loop=loop)
+        _ARENDER_SESSION_LOOP = loop
+    return _ARENDER_SESSION
+
+
+# Playwright (sync) partagé : pilote et Chromium vivent dans un thread dédié. L'API sync
+# rattache sa boucle asyncio au thread qui l'appelle (asyncio.run y devient impossible)
+# et refuse tout autre thread (greenlet) : les appelants lui confient donc le travail.
+_PW_LOCAL = threading.local()  # pilote et navigateur, propres au thread qui les a lancés
+_PW_THREAD: dict[str, Any] = {"thread": None, "jobs": None}
+_PW_THREAD_LOCK = threading.Lock()
+
+# ressources inutiles pour parser le DOM : jamais téléchargées (block_media=True)
+_BLOCKED_RESOURCES = frozenset({"image", "media", "font"})
+
+# régies publicitaires / mesure d'audience les plus courantes (domaine et sous-domaines)
+_TRACKER_HOSTS = re.compile(
+    r"(^|\.)(doubleclick\.net|googlesyndication\.com|google-analytics\.com"
+    r"|googletagmanager\.com|googleadservices\.com|facebook\.net|hotjar\.com"
+    r"|scorecardresearch\.com|criteo\.(com|net)|taboola\.com|outbrain\.com)$"
+)
+
+
+def _is_blocked(request: Any) -> bool:
+    """Whether a Playwright request is media or tracking noise (see `block_media`)."""
+    if request.resource_type in _BLOCKED_RESOURCES:
+        return True
+    return _TRACKER_HOSTS.search(urllib.parse.urlsplit(request.url).hostname or "") is not None
+
+
+def _block_resources(route: Any) -> None:
+    """Playwright route handler aborting images, media, fonts and trackers."""
+    if _is_blocked(route.request):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _get_playwright_browser() -> Any:
+    """Return this thread's sync Playwright browser, launching it on first use."""
+    browser = getattr(_PW_LOCAL, "browser", None)
+    if browser is None or not browser.is_connected():
+        if getattr(_PW_LOCAL, "pw", None) is None:
+            _PW_LOCAL.pw = get_playwright()().start()
+        browser = _PW_LOCAL.browser = _PW_LOCAL.pw.chromium.launch(headless=True)
+    return browser
+
+
+def _release_playwright() -> None:
+    """Close this thread's sync Playwright browser and driver, if any."""
+    with contextlib.suppress(Exception):
+        if getattr(_PW_LOCAL, "browser", None) is not None:
+            _PW_LOCAL.browser.close()
+        if getattr(_PW_LOCAL, "pw", None) is not None:
+            _PW_LOCAL.pw.stop()
+    _PW_LOCAL.pw = _PW_LOCAL.browser = None
+
+
+def _playwright_worker(jobs: queue.SimpleQueue) -> None:
+    """Body of the Playwright thread: run jobs until `None`, then release the browser."""
+    while (job := jobs.get()) is not None:
+        future, fn, args = job
+        if future.set_running_or_notify_cancel():
+            try:
+                future.set_result(fn(*args))
+            except BaseException as exc:  # renvoyée telle quelle à l'appelant
+                future.set_exception(exc)
+    _release_playwright()
+
+
+def _run_in_playwright_thread(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run `fn(*args)` in the thread owning the shared sync Playwright browser."""
+    with _PW_THREAD_LOCK:
+        thread = _PW_THREAD["thread"]
+        if thread is None or not thread.is_alive():
+            jobs: queue.SimpleQueue = queue.SimpleQueue()
+            # daemon : ne bloque pas la sortie, close_playwright (atexit) l'arrête proprement
+            thread = threading.Thread(
+                target=_playwright_worker, args=(jobs,), name="playwright", daemon=True
+            )
+            thread.start()
+            _PW_THREAD.update(thread=thread, jobs=jobs)
+        if thread is threading.current_thread():
+            return fn(*args)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        _PW_THREAD["jobs"].put((future, fn, args))
+    return future.result()
+
+
+@atexit.register
+def close_playwright() -> None:
+    """
+    Close the shared sync Playwright browser used by `make_soup(backend="playwright")`.
+
+    Called at exit; the next Playwright call launches a new browser.
+    """
+    with _PW_THREAD_LOCK:
+        thread, jobs = _PW_THREAD["thread"], _PW_THREAD["jobs"]
+        _PW_THREAD.update(thread=None, jobs=None)
+    if thread is not None and thread.is_alive():
+        jobs.put(None)
+        thread.join()
+
+
+# navigateur Playwright (async) partagé, lié à la boucle asyncio qui l'a lancé
+_APW_STATE: dict[str, Any] = {"pw": None, "browser": None, "loop": None, "lock": None}
+
+
+async def _ablock_resources(route: Any) -> None:
+    """Async Playwright route handler aborting images, media, fonts and trackers."""
+    if _is_blocked(route.request):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def _get_async_playwright_browser() -> Any:
+    """Return the shared async Playwright browser of the running loop, launching it once."""
+    loop = asyncio.get_running_loop()
+    if _APW_STATE["loop"] is not loop:
+        # nouvelle boucle : l'ancien navigateur (s'il existe) n'y est pas utilisable
+        _APW_STATE.update(pw=None, browser=None, loop=loop, lock=asyncio.Lock())
+    # verrou : des amake_soup lancés par gather ne démarrent qu'un seul Chromium
+    async with _APW_STATE["lock"]:
+        browser = _APW_STATE["browser"]
+        if browser is None or not browser.is_connected():
+            if _APW_STATE["pw"] is None:
+                _APW_STATE["pw"] = await get_async_playwright()().start()
+            browser = await _APW_STATE["pw"].chromium.launch(headless=True)
+            _APW_STATE["browser"] = browser
+    return browser
+
+
+async def close_session() -> None:
+    """
+    Close the shared async sessions used by `amake_soup` (aiohttp, httpx, requests_html
+    and the Playwright browser).
+
+    To be awaited before the event loop is closed (e.g. at the end of `main()`).
+    Sessions created on another event loop cannot be closed from this one: they
+    are dropped, with a RuntimeWarning.
+    """
+    global _AIOHTTP_SESSION, _AIOHTTP_SESSION_LOOP, _ARENDER_SESSION, _ARENDER_SESSION_LOOP
+    global _HTTPX_CLIENTS_LOOP, _AIOHTTP_RESOLVER, _ACACHED_SESSIONS_LOOP
+    # chaque ressource n'est fermée que dans la boucle qui l'a créée
+    if _AIOHTTP_SESSION is not None and not _AIOHTTP_SESSION.closed:
+        if _on_running_loop(_AIOHTTP_SESSION_LOOP, "La session aiohttp partagée"):
+            await _AIOHTTP_SESSION.close()
+    _AIOHTTP_SESSION = None
+    if _AIOHTTP_RESOLVER is not None and _AIOHTTP_SESSION_LOOP is asyncio.get_running_loop():
+        await _AIOHTTP_RESOLVER.close()
+    _AIOHTTP_RESOLVER = None
+    _AIOHTTP_SESSION_LOOP = None
+    open_cached = [cached for cached in _ACACHED_SESSIONS.values() if not cached.closed]
+    if open_cached and _on_running_loop(_ACACHED_SESSIONS_LOOP, "Une session aiohttp avec cache"):
+        for cached in open_cached:
+            await cached.close()
+    _ACACHED_SESSIONS.clear()
+    _ACACHED_SESSIONS_LOOP = None
+    open_clients = [client for client in _HTTPX_CLIENTS.values() if not client.is_closed]
+    if open_clients and _on_running_loop(_HTTPX_CLIENTS_LOOP, "Un client httpx partagé"):
+        for client in open_clients:
+            await client.aclose()
+    _HTTPX_CLIENTS.clear()
+    _HTTPX_CLIENTS_LOOP = None
+    if _ARENDER_SESSION is not None:
+        if _on_running_loop(_ARENDER_SESSION_LOOP, "La session requests_html partagée"):
+            await _ARENDER_SESSION.close()
+    _ARENDER_SESSION = None
+    _ARENDER_SESSION_LOOP = None
+    if _APW_STATE["loop"] is asyncio.get_running_loop():
+        with contextlib.suppress(Exception):
+            if _APW_STATE["browser"] is not None:
+                await _APW_STATE["browser"].close()
+            if _APW_STATE["pw"] is not None:
+                await _APW_STATE["pw"].stop()
+    _APW_STATE.update(pw=None, browser=None, loop=None, lock=None)
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop (libuv) as the asyncio event loop, if it is installed.
+
+    Opt-in: call it once before `asyncio.run(...)`. A custom event loop policy
+    already set by the application is left untouched.
+
+    Returns
+    -------
+    bool
+        True if uvloop is now the event loop policy, False otherwise
+        (uvloop missing, e.g. on Windows, or another custom policy in place).
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    policy = asyncio.get_event_loop_policy()
+    if isinstance(policy, uvloop.EventLoopPolicy):
+        return True
+    if type(policy) is not asyncio.DefaultEventLoopPolicy:
+        # politique choisie par l'application : on ne la remplace pas
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+@atexit.register
+def _close_session_at_exit() -> None:
+    """Best effort: close the shared async sessions if their event loop is still usable."""
+    for loop in (_AIOHTTP_SESSION_LOOP, _HTTPX_CLIENTS_LOOP, _ARENDER_SESSION_LOOP):
+        if loop is not None and not loop.is_closed() and not loop.is_running():
+            with contextlib.suppress(Exception):
+                loop.run_until_complete(close_session())
+            return
+
+
+class _TTLCache:
+    """Small LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+# réponses HTTP déjà reçues :
+# (url, en-têtes) -> (etag, last_modified, contenu, encodage, frais_jusqu_a)
+_RESPONSE_CACHE = _TTLCache(maxsize=256, ttl=600)
+
+
+def _cache_key(url: str, headers: Mapping[str, str] | None) -> tuple:
+    """Cache key for a request: the URL plus the extra headers (they may change the page)."""
+    return url, frozenset(headers.items()) if headers else None
+
+
+def _max_age(cache_control: str | None) -> float | None:
+    """
+    Return the freshness lifetime given by a Cache-Control header.
+
+    0 for "no-cache" (always revalidate), None for "no-store" (never cache).
+    """
+    if not cache_control:
+        return 0
+    max_age: float = 0
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "no-store":
+            return None
+        if name == "no-cache":
+            return 0
+        if name == "max-age":
+            with contextlib.suppress(ValueError):
+                max_age = max(0, int(value.strip('" ')))
+    return max_age
+
+
+def _conditional_headers(
+    url: str, headers: Mapping[str, str] | None
+) -> tuple[tuple | None, Mapping[str, str] | None]:
+    """Return the cached entry for `url` and `headers` made conditional (If-None-Match...)."""
+    cached = _RESPONSE_CACHE.get(_cache_key(url, headers))
+    if cached is None:
+        return None, headers
+    etag, last_modified = cached[0], cached[1]
+    cond_headers = dict(headers or {})
+    if etag:
+        cond_headers["If-None-Match"] = etag
+    if last_modified:
+        cond_headers["If-Modified-Since"] = last_modified
+    return cached, cond_headers
+
+
+def _is_fresh(cached: tuple | None) -> bool:
+    """Whether a cached entry is still fresh (Cache-Control max-age) and can skip the network."""
+    return cached is not None and cached[4] > time.monotonic()
+
+
+def _store_response(
+    url: str,
+    headers: Mapping[str, str] | None,
+    resp_headers: Mapping[str, str],
+    content: bytes,
+    encoding: str | None,
+) -> None:
+    """
+    Keep a response in `_RESPONSE_CACHE`.
+
+    Only if the server allows it and gave either a validator (ETag/Last-Modified)
+    or a max-age.
+    """
+    max_age = _max_age(resp_headers.get("Cache-Control"))
+    if max_age is None:
+        return
+    etag = resp_headers.get("ETag")
+    last_modified = resp_headers.get("Last-Modified")
+    if etag or last_modified or max_age:
+        _RESPONSE_CACHE.set(
+            _cache_key(url, headers),
+            (etag, last_modified, content, encoding, time.monotonic() + max_age),
+        )
+
+
+@functools.lru_cache(maxsize=64)
+def _parser_encoding(label: str) -> str | None:
+    """
+    Return a spelling of the encoding `label` that both Python and libxml2 accept, or None.
+
+    The label is kept as is when possible ("euc-jp", "windows-1252"): Python's
+    canonical names ("euc_jp") and some aliases ("latin-1") are unknown to
+    libxml2, so lxml would fail on them and BeautifulSoup would silently try
+    another encoding. None for labels Python does not know ("utf8mb4").
+    """
+    try:
+        python_name = codecs.lookup(label).name
+    except LookupError:
+        return None
+    if importlib.util.find_spec("lxml") is None:
+        return label
+    from lxml import etree
+
+    for candidate in (label, python_name, python_name.replace("_", "-")):
+        try:
+            etree.HTMLParser(encoding=candidate)
+        except LookupError:
+            continue
+        return candidate
+    return None
+
+
+def _charset_from_content_type(content_type: str | None) -> str | None:
+    """
+    Return the charset declared in a Content-Type header, or None.
+
+    Unlike `requests.Response.encoding`, no ISO-8859-1 default is assumed for
+    text/* without charset: the parser then reads the <meta charset> itself.
+    An unknown charset also gives None (see `_parser_encoding`).
+    """
+    if not content_type:
+        return None
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            # charset inconnu : None, on laisse le parser deviner
+            return _parser_encoding(value.strip().strip("\"'"))
+    return None
+
+
+# encodage trouvé par BeautifulSoup, par hôte : les pages suivantes du même site
+# servies sans aucun charset (ni HTTP ni <meta>) évitent la détection par chardet,
+# si leurs octets se décodent avec (un site peut mélanger les encodages)
+_HOST_ENCODINGS = _TTLCache(maxsize=256, ttl=600)
+
+
+def _page_encoding(
+    url: str, markup: str | bytes, encoding: str | None, declared: str | None
+) -> str | None:
+    """
+    Encoding to parse `markup` with, or None to let BeautifulSoup detect it.
+
+    The caller's `encoding` first (as given, unless libxml2 only knows another
+    spelling of it), then the HTTP charset. A page declaring its own (<meta
+    charset>, <?xml encoding?>) is left to BeautifulSoup, which reads it cheaply.
+    For pages without any declaration, the host's last encoding is only a hint,
+    used when the bytes agree with it (see `_hint_fits`).
+    """
+    if encoding is not None:
+        return _parser_encoding(encoding) or encoding
+    if declared is not None or isinstance(markup, str):
+        return declared
+    if EncodingDetector.find_declared_encoding(markup, is_html=True) is not None:
+        return None
+    hint: str | None = _HOST_ENCODINGS.get(urllib.parse.urlsplit(url).netloc)
+    if hint is None or not _hint_fits(markup, hint):
+        return None
+    return hint
+
+
+def _hint_fits(markup: bytes, hint: str) -> bool:
+    """
+    Whether `markup` can be decoded with the host's encoding `hint`.
+
+    A site may serve pages in several encodings: the hint must decode the bytes
+    without error, and a non-ASCII page that is valid UTF-8 is left to detection
+    unless the hint is UTF-8 (single-byte codecs like cp1252 decode anything).
+    """
+    try:
+        markup.decode(hint)
+    except (UnicodeDecodeError, LookupError):
+        return False
+    if markup.isascii() or codecs.lookup(hint).name == "utf-8":
+        return True
+    try:
+        markup.decode("utf-8")
+    except UnicodeDecodeError:
+        return True
+    return False
+
+
+def _remember_encoding(url: str, markup: str | bytes, soup: BeautifulSoup) -> None:
+    """Keep the encoding detected for an undeclared page (bytes only) as the hint for its host."""
+    if (
+        isinstance(markup, bytes)
+        and soup.original_encoding
+        # le <meta> d'une page ne dit rien des pages du site qui n'en ont pas
+        and EncodingDetector.find_declared_encoding(markup, is_html=True) is None
+    ):
+        _HOST_ENCODINGS.set(urllib.parse.urlsplit(url).netloc, soup.original_encoding)
+
+
+# résultat d'un backend : le HTML (bytes bruts si possible) et le charset annoncé
+_Fetched = tuple[str | bytes, str | None]
+
+
+def _fetch_requests_html(
+    url: str,
+    timeout: TimeoutType,
+    ssl: bool,
+    headers: Mapping[str, str] | None,
+    session: Any,
+    render_js: bool,
+    wait_until: str,
+    block_media: bool,
+) -> _Fetched:
+    """Backend "requests_html" of `_fetch_markup`."""
+    # requests_html (pyppeteer) n'est plus maintenu : playwright fait le même travail
+    _warn_deprecated('backend="requests_html"', 'backend="playwright"', stacklevel=5)
+    if session is None:
+        # session partagée : Chromium lancé une fois, réutilisé ensuite
+        session = _get_html_session()
+    # la session n'est pas fermée ici
+    resp = session.get(url, timeout=timeout, verify=ssl, headers=headers)
+    if not render_js:
+        # pas de JavaScript : on évite de lancer Chromium
+        return resp.content, _charset_from_content_type(resp.headers.get("Content-Type"))
+    resp.html.render()
+    return resp.html.html, None
+
+
+def _fetch_httpx(
+    url: str,
+    timeout: TimeoutType,
+    ssl: bool,
+    headers: Mapping[str, str] | None,
+    session: Any,
+    render_js: bool,
+    wait_until: str,
+    block_media: bool,
+) -> _Fetched:
+    """Backend "httpx" of `_fetch_markup`."""
+    if session is None:
+        # client partagé du module (pool de connexions, HTTP/2 si h2 est installé)
+        resp = _get_httpx_sync_client(ssl).get(url, headers=headers, timeout=timeout)
+    else:
+        resp = session.get(url, headers=headers)
+    resp.raise_for_status()
+    return resp.content, _charset_from_content_type(resp.headers.get("Content-Type"))
+
+
+def _fetch_playwright(
+    url: str,
+    timeout: TimeoutType,
+    ssl: bool,
+    headers: Mapping[str, str] | None,
+    session: Any,
+    render_js: bool,
+    wait_until: str,
+    block_media: bool,
+) -> _Fetched:
+    """Backend "playwright" of `_fetch_markup`; `session` is an optional Page to navigate."""
+    if session is not None:
+        # page fournie par l'appelant (son contexte, ses routes) : réutilisée, pas fermée
+        session.goto(url, timeout=(timeout or 0) * 1000, wait_until=wait_until)
+        return session.content(), None
+    fetched: _Fetched = _run_in_playwright_thread(
+        _render_playwright, url, timeout, headers, wait_until, block_media
+    )
+    return fetched
+
+
+def _render_playwright(
+    url: str,
+    timeout: TimeoutType,
+    headers: Mapping[str, str] | None,
+    wait_until: str,
+    block_media: bool,
+) -> _Fetched:
+    """Render `url` with the shared browser; runs in the Playwright thread."""
+    # navigateur partagé, contexte neuf (cookies isolés) à chaque appel
+    context = _get_playwright_browser().new_context(extra_http_headers=dict(headers or {}))
+    try:
+        if block_media:
+            context.route("**/*", _block_resources)
+        page = context.new_page()
+        page.goto(url, timeout=(timeout or 0) * 1000, wait_until=wait_until)
+        return page.content(), None
+    finally:
+        context.close()
+
+
+def _fetch_requests(
+    url: str,
+    timeout: TimeoutType,
+    ssl: bool,
+    headers: Mapping[str, str] | None,
+    session: Any,
+    render_js: bool,
+    wait_until: str,
+    block_media: bool,
+) -> _Fetched:
+    """Backend "requests" of `_fetch_markup`, also used for unknown backends."""
+    if session is not None:
+        # utilise la session fournie
+        resp = session.get(url, timeout=timeout, verify=ssl, headers=headers)
+        resp.raise_for_status()
+        return resp.content, _charset_from_content_type(resp.headers.get("Content-Type"))
+    # session partagée du module (connexions réutilisées)
+    cached, cond_headers = _conditional_headers(url, headers)
+    if _is_fresh(cached):
+        # encore frais d'après Cache-Control : aucune requête
+        return cached[2], cached[3]  # type: ignore[index]
+    resp = _get_default_session().get(url, timeout=timeout, verify=ssl, headers=cond_headers)
+    if resp.status_code == 304 and cached is not None:
+        # page inchangée : on réutilise le contenu en cache
+        return cached[2], cached[3]
+    resp.raise_for_status()
+    encoding = _charset_from_content_type(resp.headers.get("Content-Type"))
+    _store_response(url, headers, resp.headers, resp.content, encoding)
+    return resp.content, encoding
+
+
+# backends synchrones, par nom ; un nom inconnu retombe sur "requests"
+_SYNC_BACKENDS: dict[str, Callable[..., _Fetched]] = {
+    "requests": _fetch_requests,
+    "httpx": _fetch_httpx,
+    "playwright": _fetch_playwright,
+}
+if _HAS_REQUESTS_HTML:
+    _SYNC_BACKENDS["requests_html"] = _fetch_requests_html
+
+
+def _fetch_markup(
+    url: str,
+    timeout: TimeoutType = 3,
+    ssl: bool = True,
+    backend: str = "requests",
+    headers: Mapping[str, str] | None = None,
+    session: requests.Session | HTMLSession | httpx.Client | Page | None = None,
+    render_js: bool = True,
+    wait_until: str = "domcontentloaded",
+    block_media: bool = False,
+) -> _Fetched:
+    """
+    Fetch a page with the given sync backend (see `make_soup`).
+
+    Returns the markup and its declared encoding: raw bytes + charset from the
+    HTTP headers when available, so the parser can decode them itself.
+    """
+    fetch: Callable[..., _Fetched] = _SYNC_BACKENDS.get(backend, _fetch_requests)
+    return fetch(url, timeout, ssl, headers, session, render_js, wait_until, block_media)
+
+
+async def _afetch_requests_html(
+    url: str,
+    timeout: TimeoutType,
+    ssl: bool,
+    headers: Mapping[str, str] | None,
+    session: Any,
+    render_js: bool,
+    wait_until: str,
+    block_media: bool,
+) -> _Fetched:
+    """Backend "requests_html" of `_afetch_markup`."""
+    _warn_deprecated('backend="requests_html"', 'backend="playwright"', stacklevel=5)
+    if session is None:
+        # session partagée : Chromium lancé une fois par boucle asyncio
+        session = _get_arender_session()
+    resp = await session.get(url, timeout=timeout, verify=ssl, headers=headers)
+    if not render_js:
+        # pas de JavaScript : on évite de lancer Chromium
+        return resp.content, _charset_from_content_type(resp.headers.get("Content-Type"))
+    await resp.html.arender()
+    return resp.html.html, None
+
+
+async def _afetch_httpx(
+    url: str,
+    timeout: TimeoutType,
+    ssl: bool,
+    headers: Mapping[str, str] | None,
+    session: Any,
+    render_js: bool,
+    wait_until: str,
+    block_media: bool,
+) -> _Fetched:
+    """Backend "httpx" of `_afetch_markup`."""
+    if session is None:
+        # client partagé du module (pool de connexions, HTTP/2 si h2 est installé)
+        resp = await _get_httpx_client(ssl).get(url, headers=headers, timeout=timeout)
+    else:
+        resp = await session.get(url, headers=headers)
+    resp.raise_for_status()
+    return resp.content, _charset_from_content_type(resp.headers.get("Content-Type"))
+
+
+async def _afetch_playwright(
+    url: str,
+    timeout: TimeoutType,
+    ssl: bool,
+    headers: Mapping[str, str] | None,
+    session: Any,
+    render_js: bool,
+    wait_until: str,
+    block_media: bool,
+) -> _Fetched:
+    """Backend "playwright" of `_afetch_markup`; `session` is an optional Page to navigate."""
+    if session is not None:
+        # page fournie par l'appelant (son contexte, ses routes) : réutilisée, pas fermée
+        await session.goto(url, timeout=(timeout or 0) * 1000, wait_until=wait_until)
+        return await session.content(), None
+    # navigateur partagé, contexte neuf (cookies isolés) à chaque appel
+    browser = await _get_async_playwright_browser()
+    context = await browser.new_context(extra_http_headers=dict(headers or {}))
+    try:
+        if block_media:
+            await context.route("**/*", _ablock_resources)
+        page = await context.new_page()
+        await page.goto(url, timeout=(timeout or 0) * 1000, wait_until=wait_until)
+        return await page.content(), None
+    finally:
+        await context.close()
+
+
+async def _afetch_aiohttp(
+    url: str,
+    timeout: TimeoutType,
+    ssl: bool,
+    headers: Mapping[str, str] | None,
+    session: Any,
+    render_js: bool,
+    wait_until: str,
+    block_media: bool,
+) -> _Fetched:
+    """Backend "aiohttp" of `_afetch_markup`, also used for unknown backends."""
+    import aiohttp
+
+    timeout_obj = aiohttp.ClientTimeout(total=timeout)
+    if session is not None:
+        # session fournie (ou session avec cache de `cache=`) : même délai que sans session
+        async with session.get(url, ssl=ssl, timeout=timeout_obj, headers=headers) as resp:
+            resp.raise_for_status()
+            return await resp.read(), _charset_from_content_type(resp.headers.get("Content-Type"))
+    # session partagée du module (pool de connexions, keep-alive)
+    shared = await _get_session()
+    cached, cond_headers = _conditional_headers(url, headers)
+    if _is_fresh(cached):
+        # encore frais d'après Cache-Control : aucune requête
+        return cached[2], cached[3]  # type: ignore[index]
+    async with shared.get(url, ssl=ssl, timeout=timeout_obj, headers=cond_headers) as resp:
+        if resp.status == 304 and cached is not None:
+            # page inchangée : on réutilise le contenu en cache
+            return cached[2], cached[3]
+        resp.raise_for_status()
+        content = await resp.read()
+        encoding = _charset_from_content_type(resp.headers.get("Content-Type"))
+        _store_response(url, headers, resp.headers, content, encoding)
+        return content, encoding
+
+
+# backends asynchrones, par nom ; un nom inconnu retombe sur "aiohttp"
+_ASYNC_BACKENDS: dict[str, Callable[..., Awaitable[_Fetched]]] = {
+    "aiohttp": _afetch_aiohttp,
+    "httpx": _afetch_httpx,
+    "playwright": _afetch_playwright,
+}
+if _HAS_REQUESTS_HTML:
+    _ASYNC_BACKENDS["requests_html"] = _afetch_requests_html
+
+
+async def _afetch_markup(
+    url: str,
+    timeout: TimeoutType = 3,
+    ssl: bool = False,
+    backend: str = "aiohttp",
+    headers: Mapping[str, str] | None = None,
+    session: aiohttp.ClientSession | AsyncHTMLSession | HTMLSession | AsyncPage | None = None,
+    render_js: bool = True,
+    wait_until: str = "domcontentloaded",
+    block_media: bool = False,
+) -> _Fetched:
+    """Fetch a page with the given async backend (see `amake_soup` and `_fetch_markup`)."""
+    fetch: Callable[..., Awaitable[_Fetched]] = _ASYNC_BACKENDS.get(backend, _afetch_aiohttp)
+    return await fetch(url, timeout, ssl, headers, session, render_js, wait_until, block_media)
 
 
 def make_soup(
     url: str,
-    parser: str = "html.parser",
+    parser: str = _DEFAULT_PARSER,
     timeout: TimeoutType = 3,
     ssl: bool = True,
     backend: str = "requests",
-    headers: dict | None = None,
-    session: requests.Session | HTMLSession | None = None,
+    headers: Mapping[str, str] | None = None,
+    session: requests.Session | HTMLSession | httpx.Client | Page | None = None,
+    render_js: bool = True,
+    parse_only: SoupStrainer | None = None,
+    cache: str | os.PathLike[str] | None = None,
+    wait_until: str = "domcontentloaded",
+    block_media: bool = False,
+    encoding: str | None = None,
 ) -> BeautifulSoup:
     """
     Fetch an HTML page and return a BeautifulSoup object.
@@ -67,8 +1132,10 @@ def make_soup(
     url : str
         The URL of the page to fetch.
     parser : str, optional
-        Parser used by BeautifulSoup. Default is "html.parser".
-        lxml is faster and recommanded.
+        Parser used by BeautifulSoup. Default is "lxml" (falls back to
+        "html.parser" if lxml is not installed). "html5lib" repairs badly
+        broken markup the way a browser does, but is several times slower:
+        only use it when lxml builds a wrong tree.
     timeout : int or float, optional
         Maximum request timeout in seconds. Default is 3.
     ssl : bool, optional
@@ -76,64 +1143,120 @@ def make_soup(
     backend : str, optional
         Backend to use. default "requests".
         - "requests" (par défaut) : HTML statique avec requests.
-        - "requests_html" : HTMLSession + Pyppeteer (⚠ fragile, dépend de Chromium).
+        - "requests_html" : HTMLSession + Pyppeteer (⚠ obsolète, préférer "playwright").
+        - "httpx" : httpx.Client partagé (HTTP/2 si h2 est installé).
         - "playwright" : Playwright en mode synchrone (Chromium headless),
-                         fiable pour exécuter du JavaScript.
+                         fiable pour exécuter du JavaScript. Le navigateur est
+                         lancé une fois, dans un thread dédié, puis réutilisé
+                         depuis n'importe quel thread (cf. `close_playwright`,
+                         `wait_until` et `block_media`).
 
     headers : dict, optional
-        Additional HTTP headers to include in the request.
-    session : requests.Session or HTMLSession, optional
-        Existing session to reuse. If None, a new one is created internally.
+        Additional HTTP headers to include in the request (merged over
+        `DEFAULT_HEADERS` when the shared session is used).
+    session : requests.Session, HTMLSession, httpx.Client or playwright Page, optional
+        Existing session to reuse. If None, the "requests" backend uses a
+        module-level `requests.Session` (keep-alive, connection pool), "httpx"
+        a module-level `httpx.Client` and "requests_html" a shared
+        HTMLSession, so Chromium is launched once. With "playwright", a Page
+        is navigated to `url` and left open (its context keeps cookies and
+        routes; `block_media` is not applied to it); otherwise a fresh context
+        of the shared browser is used for each call.
+    render_js : bool, optional
+        With the "requests_html" backend, whether to run the page JavaScript
+        (`resp.html.render()`, seconds per page). Default is True. Set it to
+        False for static pages; JS-heavy sites need True or "playwright".
+    parse_only : SoupStrainer, optional
+        Only build the matching tags (e.g. `SoupStrainer("form")`), which
+        saves time and memory when a small part of the page is needed.
+    cache : str or path-like, optional
+        SQLite file of a persistent HTTP cache (requests-cache, extra "cache"),
+        kept across runs: responses are reused for up to 1 hour, or as long as
+        their Cache-Control allows. Only for the "requests" backend without
+        `session`. Default is None (in-memory cache below only).
+    wait_until : str, optional
+        With "playwright", page event awaited before reading the DOM. Default is
+        "domcontentloaded" (no wait for subresources); "load" or "networkidle"
+        for pages that build their content late.
+    block_media : bool, optional
+        With "playwright", skip images, media, fonts and known ad/analytics
+        hosts: faster loads, but pages that load content after their images
+        (lazy loading) may render differently. Default is False.
+    encoding : str, optional
+        Encoding of the page, when known: skips charset detection. Default is
+        None: the HTTP charset, else the page's own declaration, else detection
+        by BeautifulSoup. For pages declaring nothing, the encoding last found
+        for the same host is tried first if the bytes decode with it.
+
+    Notes
+    -----
+    With the shared session of the "requests" backend, responses are kept for
+    up to 10 minutes, keyed by URL and `headers`. While the Cache-Control
+    max-age holds, the page is served without any request; afterwards, if it
+    carried an ETag or Last-Modified header, the fetch is conditional and a
+    304 reuses the cached body (no download). "no-store" disables caching.
 
     Returns
     -------
     BeautifulSoup
         Parsed HTML content of the page.
     """
-    if backend == "requests_html" and HTMLSession is not None:
-        if session is None:
-            # crée et ferme automatiquement la session
-            with HTMLSession() as s:
-                resp = s.get(url, timeout=timeout, verify=ssl, headers=headers)
-                resp.html.render()  # type: ignore[attr-defined]
-                return BeautifulSoup(resp.html.html, features=parser)  # type: ignore
-        else:
-            # utilise la session fournie, sans la fermer
-            resp = session.get(url, timeout=timeout, verify=ssl, headers=headers)
-            resp.html.render()  # type: ignore
-            return BeautifulSoup(resp.html.html, features=parser)  # type: ignore
-
-    elif backend == "playwright":
-        with get_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, timeout=(timeout or 0) * 1000)
-            html = page.content()
-            browser.close()
-            return BeautifulSoup(html, features=parser)
+    if cache is not None and session is None and backend == "requests":
+        session = _get_cached_session(cache)
+    markup, declared = _fetch_markup(
+        url,
+        timeout=timeout,
+        ssl=ssl,
+        backend=backend,
+        headers=headers,
+        session=session,
+        render_js=render_js,
+        wait_until=wait_until,
+        block_media=block_media,
+    )
+    page_encoding = _page_encoding(url, markup, encoding, declared)
+    soup = _parse_soup(markup, parser, page_encoding, parse_only)
+    if page_encoding is None:
+        _remember_encoding(url, markup, soup)
+    return soup
+
+
+def _parse_soup(
+    markup: str | bytes,
+    parser: str,
+    encoding: str | None,
+    parse_only: SoupStrainer | None = None,
+) -> BeautifulSoup:
+    """
+    Parse markup with the cached TreeBuilder of `parser`.
 
-    else:
-        if session is None:
-            # requête jetable avec requests
-            resp = requests.get(url, timeout=timeout, verify=ssl, headers=headers)
-            resp.raise_for_status()
-            return BeautifulSoup(resp.text, features=parser)
-        else:
-            # utilise la session fournie
-            resp = session.get(url, timeout=timeout, verify=ssl, headers=headers)
-            resp.raise_for_status()
-            return BeautifulSoup(resp.text, features=parser)
+    Top-level function so a ProcessPoolExecutor can pickle it.
+    """
+    builder = _builder_for(parser)
+    if builder is None:
+        # parser inconnu : BeautifulSoup lève FeatureNotFound
+        return BeautifulSoup(
+            markup, features=parser, from_encoding=encoding, parse_only=parse_only
+        )
+    return BeautifulSoup(markup, builder=builder, from_encoding=encoding, parse_only=parse_only)
 
 
 async def amake_soup(
     url: str,
     *,
-    parser: str = "html.parser",
+    parser: str = _DEFAULT_PARSER,
     timeout: TimeoutType = 3,
     ssl: bool = False,
     backend: str = "aiohttp",
-    headers: dict | None = None,
-    session: aiohttp.ClientSession | AsyncHTMLSession | HTMLSession | None = None,
+    headers: Mapping[str, str] | None = None,
+    session: aiohttp.ClientSession | AsyncHTMLSession | HTMLSession | AsyncPage | None = None,
+    render_js: bool = True,
+    parse_only: SoupStrainer | None = None,
+    cache: str | os.PathLike[str] | None = None,
+    wait_until: str = "domcontentloaded",
+    block_media: bool = False,
+    encoding: str | None = None,
+    executor: concurrent.futures.Executor | None = None,
 ) -> BeautifulSoup:
     """
     Fetch an HTML page asynchronously and return a BeautifulSoup object.
@@ -143,8 +1266,9 @@ async def amake_soup(
     url : str
         The URL of the page to fetch.
     parser : str, optional
-        Parser used by BeautifulSoup. Default is "html.parser".
-        Options include "lxml" and "html5lib".
+        Parser used by BeautifulSoup. Default is "lxml" (falls back to
+        "html.parser" if lxml is not installed).
+        Options include "html.parser" and "html5lib".
     timeout : int or float, optional
         Maximum request timeout in seconds. Default is 3.
     ssl : bool, optional
@@ -153,18 +1277,46 @@ async def amake_soup(
     backend : str, optional
         HTTP backend to use. Default is "aiohttp".
         - "aiohttp" : uses aiohttp.ClientSession
-        - "requests_html" : uses AsyncHTMLSession (if installed)
+        - "requests_html" : uses AsyncHTMLSession (if installed; deprecated,
+          use "playwright")
         - "httpx" : uses httpx.AsyncClient
-        - "playwright" : uses playwright client (Chromium)
+        - "playwright" : uses playwright client (Chromium), one browser per
+          event loop reused across calls (see `wait_until` / `block_media`)
     headers : dict, optional
-        Additional HTTP headers to include in the request.
+        Additional HTTP headers to include in the request (merged over
+        `DEFAULT_HEADERS` when the shared aiohttp session is used).
     session : AsyncHTMLSession, aiohttp.ClientSession or httpx.AsyncClient, optional
-        Existing async session to reuse. If None, a new one is created internally.
+        Existing async session to reuse. If None, the "aiohttp", "httpx" and
+        "requests_html" backends use shared module-level sessions and
+        "playwright" a shared browser (see `close_session`); a playwright
+        async Page is used as is with "playwright", like in `make_soup`.
+        The shared aiohttp session revalidates cached responses like
+        `make_soup` does (ETag / Last-Modified, 304 reuses the cached body).
+    render_js : bool, optional
+        With the "requests_html" backend, whether to run the page JavaScript
+        (`resp.html.arender()`). Default is True; see `make_soup`.
+    parse_only : SoupStrainer, optional
+        Only build the matching tags; see `make_soup`.
+    cache : str or path-like, optional
+        SQLite file of a persistent HTTP cache (aiohttp-client-cache, extra
+        "cache"); see `make_soup`. Only for the "aiohttp" backend without `session`.
+    wait_until, block_media : optional
+        Playwright page loading options; see `make_soup`.
+    encoding : str, optional
+        Encoding of the page, when known; see `make_soup`.
+    executor : concurrent.futures.Executor, optional
+        Executor used to parse the page. Default is None: a worker thread
+        (`asyncio.to_thread`). Pass a `ProcessPoolExecutor` to parse big pages
+        on several cores at once; the soup is then pickled back to the caller,
+        which only pays off for pages of a few MB.
 
     Returns
     -------
     BeautifulSoup
-        Parsed HTML content of the page.
+        Parsed HTML content of the page. Parsing runs outside the event loop
+        so it keeps serving other fetches meanwhile. The body is read in full
+        first (BeautifulSoup has no incremental API); `amake_tree` streams it
+        into lxml's incremental parser instead, for big pages.
 
     Raises
     ------
@@ -179,77 +1331,214 @@ async def amake_soup(
     >>> print(soup.title.string)
     'Example Domain'
     """
-    if backend == "requests_html" and AsyncHTMLSession is not None:
-        if session is None:
-            session = AsyncHTMLSession()
-            # Cast en Any pour éviter les erreurs sur verify/timeout
-            session_any: Any = session
-            resp: Any = await session_any.get(
-                url, timeout=timeout, verify=ssl, headers=headers  # type: ignore[call-arg]
-            )  # type: ignore[call-arg]
-
-            await resp.html.arender()  # ignore: type
-            return BeautifulSoup(resp.html.html, features=parser)
-        else:
-            resp = await session.get(
-                url,
-                timeout=timeout,  # type: ignore[call-arg, arg-type]
-                verify=ssl,  # type: ignore
-                headers=headers,
-            )  # type: ignore[call-arg]
-
-            await resp.html.arender()  # type: ignore
-            return BeautifulSoup(resp.html.html, features=parser)  # type: ignore
-
-    elif backend == "httpx":
-        import httpx
+    if cache is not None and session is None and backend == "aiohttp":
+        session = _get_acached_session(cache)
+    markup, declared = await _afetch_markup(
+        url,
+        timeout=timeout,
+        ssl=ssl,
+        backend=backend,
+        headers=headers,
+        session=session,
+        render_js=render_js,
+        wait_until=wait_until,
+        block_media=block_media,
+    )
+    page_encoding = _page_encoding(url, markup, encoding, declared)
+    # parsing CPU-bound : hors de la boucle asyncio pour ne pas la bloquer
+    if executor is not None:
+        loop = asyncio.get_running_loop()
+        soup = await loop.run_in_executor(
+            executor, _parse_soup, markup, parser, page_encoding, parse_only
+        )
+    else:
+        soup = await asyncio.to_thread(_parse_soup, markup, parser, page_encoding, parse_only)
+    if page_encoding is None:
+        _remember_encoding(url, markup, soup)
+    return soup
 
-        if session is None:
-            async with httpx.AsyncClient(timeout=timeout, verify=ssl, headers=headers) as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                return BeautifulSoup(resp.text, features=parser)
-        else:
-            resp = await session.get(url, headers=headers)  # type: ignore
-            resp.raise_for_status()
-            return BeautifulSoup(resp.text, features=parser)  # type: ignore
-
-    elif backend == "playwright":
-        async with get_async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
-            if headers:
-                await page.set_extra_http_headers(headers)
-            await page.goto(url, timeout=(timeout or 0) * 1000)
-            html = await page.content()
-            await browser.close()
-        return BeautifulSoup(html, "html.parser")
-
-    else:  # aiohttp par défaut
-        timeout_obj = aiohttp.ClientTimeout(total=timeout)
-        if session is None:
-            async with aiohttp.ClientSession(timeout=timeout_obj, headers=headers) as client:
-                async with client.get(url, ssl=ssl) as resp:
-                    resp.raise_for_status()
-                    text = await resp.text()
-                    return BeautifulSoup(text, features=parser)
-        else:
-            async with session.get(url, ssl=ssl, headers=headers) as resp:  # type: ignore[arg-type]
-                resp.raise_for_status()
-                text = await resp.text()
-                return BeautifulSoup(text, features=parser)
 
+async def amake_soups(
+    urls: Iterable[str],
+    concurrency: int = 16,
+    *,
+    parser: str = _DEFAULT_PARSER,
+    timeout: TimeoutType = 3,
+    backend: str = "aiohttp",
+    headers: Mapping[str, str] | None = None,
+    return_exceptions: bool = False,
+    **kwargs: Any,
+) -> list[Any]:
+    """
+    Fetch several HTML pages concurrently and return their BeautifulSoup objects.
 
-def soup_from_text(text: str, parser: str = "html.parser") -> BeautifulSoup:
+    Parameters
+    ----------
+    urls : iterable of str
+        URLs of the pages to fetch.
+    concurrency : int, optional
+        Maximum number of requests in flight at the same time. Default is 16.
+    parser, timeout, backend, headers
+        Same as `amake_soup`, applied to every URL.
+    return_exceptions : bool, optional
+        If True, a failing URL yields its exception in the result list instead
+        of aborting the whole batch. Default is False.
+    **kwargs
+        Other keyword arguments passed to `amake_soup` (ssl, session, cache, ...).
+
+    Returns
+    -------
+    list of BeautifulSoup
+        Parsed pages, in the same order as `urls` (with the exceptions in place
+        of failed pages when `return_exceptions` is True).
+
+    Examples
+    --------
+    >>> soups = await amake_soups(["https://example.com", "https://example.org"])
+    >>> [s.title.string for s in soups]
+    ['Example Domain', 'Example Domain']
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _one(url: str) -> BeautifulSoup:
+        async with sem:
+            return await amake_soup(
+                url, parser=parser, timeout=timeout, backend=backend, headers=headers, **kwargs
+            )
+
+    return list(
+        await asyncio.gather(*(_one(u) for u in urls), return_exceptions=return_exceptions)
+    )
+
+
+def make_tree(
+    url: str,
+    timeout: TimeoutType = 3,
+    ssl: bool = True,
+    backend: str = "requests",
+    headers: Mapping[str, str] | None = None,
+    session: requests.Session | HTMLSession | httpx.Client | Page | None = None,
+    stream: bool = False,
+) -> HtmlElement:
+    """
+    Fetch an HTML page and return the raw lxml tree, without BeautifulSoup.
+
+    Same arguments as `make_soup` (minus `parser`). BeautifulSoup rebuilds a
+    Python tree on top of the lxml one; skipping it makes parsing several
+    times faster (lxml alone runs in a few % of the time of BeautifulSoup + lxml).
+    Use it when `.cssselect()` / `.xpath()` are enough.
+
+    Parameters
+    ----------
+    stream : bool, optional
+        With the "requests" backend, feed the body to lxml's incremental parser
+        chunk by chunk as it is downloaded, like `amake_tree` does: lower peak
+        memory on big pages. Bypasses the in-memory response cache. Default is False.
+
+    Returns
+    -------
+    lxml.html.HtmlElement
+        Root element of the parsed page.
+    """
+    if (
+        stream
+        and backend == "requests"
+        and (session is None or isinstance(session, requests.Session))
+    ):
+        return _stream_tree(url, timeout=timeout, ssl=ssl, headers=headers, session=session)
+    markup, encoding = _fetch_markup(
+        url, timeout=timeout, ssl=ssl, backend=backend, headers=headers, session=session
+    )
+    return tree_from_text(markup, encoding=encoding)
+
+
+def _stream_tree(
+    url: str,
+    timeout: TimeoutType = 3,
+    ssl: bool = True,
+    headers: Mapping[str, str] | None = None,
+    session: requests.Session | None = None,
+) -> HtmlElement:
+    """Stream the body of `url` into an incremental lxml parser (requests backend)."""
+    client = session if session is not None else _get_default_session()
+    with client.get(url, timeout=timeout, verify=ssl, headers=headers, stream=True) as resp:
+        resp.raise_for_status()
+        parser = _lxml_parser(_charset_from_content_type(resp.headers.get("Content-Type")))
+        # iter_content décompresse (gzip, br...) au fil de l'eau
+        for chunk in resp.iter_content(65536):
+            parser.feed(chunk)
+    return parser.close()
+
+
+async def amake_tree(
+    url: str,
+    *,
+    timeout: TimeoutType = 3,
+    ssl: bool = False,
+    backend: str = "aiohttp",
+    headers: Mapping[str, str] | None = None,
+    session: aiohttp.ClientSession | AsyncHTMLSession | HTMLSession | None = None,
+) -> HtmlElement:
+    """
+    Asynchronous version of `make_tree` (same arguments as `amake_soup` minus `parser`).
+
+    With the "aiohttp" backend the body is streamed into lxml's incremental
+    parser: parsing overlaps with the download and the whole page is never
+    held as a Python string.
+
+    Returns
+    -------
+    lxml.html.HtmlElement
+        Root element of the parsed page.
+    """
+    if backend == "aiohttp":
+        return await _astream_tree(url, timeout=timeout, ssl=ssl, headers=headers, session=session)
+    markup, encoding = await _afetch_markup(
+        url, timeout=timeout, ssl=ssl, backend=backend, headers=headers, session=session
+    )
+    # lxml relâche le GIL pendant le parsing : vrai parallélisme dans le thread
+    return await asyncio.to_thread(tree_from_text, markup, encoding=encoding)
+
+
+async def _astream_tree(
+    url: str,
+    timeout: TimeoutType = 3,
+    ssl: bool = False,
+    headers: Mapping[str, str] | None = None,
+    session: aiohttp.ClientSession | None = None,
+) -> HtmlElement:
+    """Stream the body of `url` into an incremental lxml parser (aiohttp backend)."""
+    import aiohttp
+
+    client = session if session is not None else await _get_session()
+    timeout_obj = aiohttp.ClientTimeout(total=timeout)
+    async with client.get(url, ssl=ssl, timeout=timeout_obj, headers=headers) as resp:
+        resp.raise_for_status()
+        # le parsing commence dès le premier bloc reçu, sans garder tout le corps en mémoire
+        # même contrôle du charset que _stream_tree : un charset inconnu de libxml2
+        # ("latin-1", "utf8mb4") donne None et lxml détecte l'encodage
+        parser = _lxml_parser(_charset_from_content_type(resp.headers.get("Content-Type")))
+        async for chunk in resp.content.iter_chunked(65536):
+            parser.feed(chunk)
+    return parser.close()
+
+
+def soup_from_text(
+    text: str | bytes,
+    parser: str = _DEFAULT_PARSER,
+    parse_only: SoupStrainer | None = None,
+) -> BeautifulSoup:
     """
     Construit un objet BeautifulSoup directement à partir d'une chaîne HTML.
 
     Args:
         text (str): Chaîne contenant du HTML brut.
         parser (str, optional): Parser utilisé pour analyser le HTML.
-            - "html.parser" (par défaut)
-            - "lxml"
+            - "lxml" (par défaut, "html.parser" si lxml n'est pas installé)
+            - "html.parser"
             - "html5lib"
+        parse_only (SoupStrainer, optional): Ne construit que les balises
+            correspondantes (ex. `SoupStrainer("form")`), le reste est ignoré.
 
     Returns:
         BeautifulSoup: Objet représentant l'arbre DOM du HTML fourni.
@@ -260,17 +1549,109 @@ def soup_from_text(text: str, parser: str = "html.parser") -> BeautifulSoup:
         >>> print(soup.title.string)
         'Hello'
     """  # noqa: E501
-    return BeautifulSoup(text, features=parser)
+    return _parse_soup(text, parser, None, parse_only)
+
+
+def _builder_for(parser: str) -> TreeBuilder | None:
+    """Return a cached TreeBuilder instance for `parser`, or None if BS4 doesn't know it."""
+    cache: dict[str, TreeBuilder | None] | None = getattr(_BUILDERS, "cache", None)
+    if cache is None:
+        cache = _BUILDERS.cache = {}
+    if parser not in cache:
+        builder_class = builder_registry.lookup(parser)
+        cache[parser] = builder_class() if builder_class is not None else None
+    return cache[parser]
+
+
+def tree_from_text(text: str | bytes, encoding: str | None = None) -> HtmlElement:
+    """
+    Construit un arbre lxml directement à partir d'une chaîne HTML (sans BeautifulSoup).
+
+    Args:
+        text (str | bytes): Chaîne contenant du HTML brut.
+        encoding (str | None, optional): Encodage de `text` s'il s'agit de bytes.
+            Si None, lxml le détecte (<meta charset>).
+
+    Returns:
+        lxml.html.HtmlElement: Élément racine, interrogeable avec `.cssselect()` / `.xpath()`.
+            Les commentaires HTML ne sont pas conservés.
+
+    Example:
+        >>> tree = tree_from_text("<html><head><title>Hello</title></head></html>")
+        >>> tree.findtext(".//title")
+        'Hello'
+    """
+    import lxml.html
+
+    if isinstance(text, str):
+        # lxml refuse les str avec une déclaration d'encodage : on repasse en bytes
+        return lxml.html.fromstring(text.encode("utf-8"), parser=_shared_lxml_parser("utf-8"))
+    return lxml.html.fromstring(text, parser=_shared_lxml_parser(encoding))
+
+
+def _lxml_parser(encoding: str | None) -> Any:
+    """Return an lxml HTML parser stripped of the features the helpers never use."""
+    import lxml.html
+
+    # ni index des id (get_element_by_id passe par XPath), ni nœuds commentaires à allouer
+    return lxml.html.HTMLParser(encoding=encoding, collect_ids=False, remove_comments=True)
+
 
+def _shared_lxml_parser(encoding: str | None) -> Any:
+    """
+    Return this thread's cached `_lxml_parser(encoding)`.
 
-def extract_name_value_pairs(soup: BeautifulSoup | Tag, selector: str, attr: str = "value") -> dict:
+    Only for one-shot parsing (`fromstring`): the incremental `feed()` of
+    `_stream_tree` / `_astream_tree` keeps state between chunks, and several
+    coroutines of the same loop would interleave their pages in it.
+    """
+    cache: dict[str | None, Any] | None = getattr(_LXML_PARSERS, "cache", None)
+    if cache is None:
+        cache = _LXML_PARSERS.cache = {}
+    key = encoding.lower() if encoding else None
+    if key not in cache:
+        if len(cache) >= 16:
+            # charsets exotiques envoyés par les serveurs : on ne garde pas tout
+            cache.clear()
+        cache[key] = _lxml_parser(encoding)
+    return cache[key]
+
+
+# nom d'attribut utilisable tel quel dans une expression XPath
+_XPATH_NAME = re.compile(r"[A-Za-z_][\w.-]*")
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pairs_xpath(selector: str, attr: str) -> XPath:
+    """
+    Compile once the XPath of `extract_name_value_pairs` for a CSS selector.
+
+    The name / attribute filter is part of the expression, so libxml2 only
+    returns the elements having both attributes.
+    """
+    from cssselect import HTMLTranslator
+    from lxml.etree import XPath
+
+    # descendants seulement, comme soup.select() : l'élément de départ n'est jamais renvoyé
+    xpath = HTMLTranslator().css_to_xpath(selector, prefix="descendant::")
+    # attribut exotique (ex. "xml:lang") : comparé par son nom plutôt qu'inséré dans l'XPath
+    has_attr = f"@{attr}" if _XPATH_NAME.fullmatch(attr) else "@*[name() = $attr]"
+    # parenthèses : le sélecteur peut être une union ("a, b" -> "... | ...")
+    return XPath(f"({xpath})[@name and {has_attr}]")
+
+
+def extract_name_value_pairs(
+    soup: BeautifulSoup | Tag | HtmlElement | str | bytes, selector: str, attr: str = "value"
+) -> dict:
     """
     Extrait les paires (name:attr) des balises HTML sélectionnées.
 
     Paramètres
     ----------
-    soup : BeautifulSoup | Tag
-        Objet BeautifulSoup représentant le DOM ou un sous-arbre.
+    soup : BeautifulSoup | Tag | lxml.html.HtmlElement | str | bytes
+        Objet BeautifulSoup représentant le DOM ou un sous-arbre,
+        arbre lxml (cf. `make_tree` / `tree_from_text`),
+        ou HTML brut (cf. `extract_name_value_pairs_fast`).
     selector : str
         Sélecteur CSS pour cibler les balises (ex. "input", "meta").
     attr : str, optionnel
@@ -302,47 +1683,110 @@ def extract_name_value_pairs(soup: BeautifulSoup | Tag, selector: str, attr: str
     >>> soup = BeautifulSoup(html, "html.parser")
     >>> extract_name_value_pairs(soup, "meta", attr="content")
     {'viewport': 'width=device-width'}
+
+    >>> tree = tree_from_text('<input type="hidden" name="csrf" value="abc123">')
+    >>> extract_name_value_pairs(tree, "input")
+    {'csrf': 'abc123'}
+    """
+    if isinstance(soup, (str, bytes)):
+        return extract_name_value_pairs_fast(soup, selector, attr=attr)
+    if not isinstance(soup, Tag):
+        # arbre lxml : sélection CSS en C, sans passer par BeautifulSoup
+        return {
+            el.get("name"): el.get(attr)
+            for el in _compile_pairs_xpath(selector, attr)(soup, attr=attr)
+        }
+    # une seule recherche par attribut (has_attr puis [] en faisaient deux)
+    pairs = ((tag.attrs.get("name"), tag.attrs.get(attr)) for tag in soup.select(selector))
+    return {name: value for name, value in pairs if name is not None and value is not None}
+
+
+def extract_name_value_pairs_fast(html: str | bytes, selector: str, attr: str = "value") -> dict:
+    """
+    Version rapide de `extract_name_value_pairs` travaillant sur du HTML brut.
+
+    Le parsing et la sélection CSS sont faits en C par selectolax, sans
+    construire d'arbre BeautifulSoup (10 à 30x plus rapide sur les pages lourdes).
+    Utilise le moteur Lexbor (le moteur Modest est retiré de selectolax 1.0).
+    Sans selectolax, passe par un arbre lxml et un sélecteur XPath compilé
+    (libxml2, en C également).
+
+    Paramètres
+    ----------
+    html : str | bytes
+        HTML brut de la page (ou d'un fragment).
+    selector : str
+        Sélecteur CSS pour cibler les balises (ex. "input", 'form[method="post"] input').
+    attr : str, optionnel
+        Attribut à extraire comme valeur. Par défaut "value".
+
+    Retour
+    ------
+    dict
+        Dictionnaire {name: attr}, comme `extract_name_value_pairs`.
+
+    Exemples
+    --------
+    >>> extract_name_value_pairs_fast('<input name="csrf" value="abc123">', "input")
+    {'csrf': 'abc123'}
     """
-    items = soup.select(selector)
-    return {i["name"]: i[attr] for i in items if i.has_attr("name") and i.has_attr(attr)}
+    if not _HAS_SELECTOLAX:
+        return extract_name_value_pairs(tree_from_text(html), selector, attr=attr)
+    tree = get_selectolax()(html)
+    return {
+        # attribut sans valeur (<input value>) : None chez selectolax, "" chez BS4
+        attrs["name"]: attrs[attr] or ""
+        # node.attributes reconstruit un dict à chaque accès : une seule fois par nœud
+        for attrs in (node.attributes for node in tree.css(selector))
+        if "name" in attrs and attr in attrs
+    }
 
 
-def extract_form(form: Tag) -> dict:
+def extract_form(form: Tag | HtmlElement) -> dict:
     """
     Extracts (name:value) pairs from <input> tags in an HTML form.
 
     Args:
-        url (str): URL of the page containing the form.
-        headers (dict | None, optional): HTTP headers to include in the request.
-        backend (str, optional): Backend used by `make_soup` ("requests", "playwright", etc.).
-        session (requests.Session | HTMLSession | None, optional):
-            HTTP session (e.g., requests.Session) to preserve cookies and tokens.
-        timeout (int, optional): Maximum timeout in seconds for the GET request (default 30).
+        form (Tag | lxml.html.HtmlElement): The <form> element, as a BeautifulSoup
+            tag (e.g. from `make_soup`) or an lxml element (e.g. from `make_tree`).
 
     Returns:
         dict[str, str]: Dictionary {name: value} extracted from the form fields.
 
-    Raises:
-        ValueError: If no `<form method="post">` is found in the page.
-
     Notes:
-        - Uses `make_soup` to fetch and parse the page.
-        - If a session is provided, it is used for the GET request.
-        - The same session can be reused for the login POST request.
+        - Inputs without a name or a value attribute are skipped.
+        - An lxml element goes through the compiled XPath of
+          `extract_name_value_pairs` (libxml2, no Python loop over the nodes).
     """
-    return {
-        i["name"]: i["value"]
-        for i in form.select("input")
-        if i.has_attr("name") and i.has_attr("value")
-    }
+    if not isinstance(form, Tag):
+        return extract_name_value_pairs(form, "input")
+    # find_all natif de BS4 plutôt que select("input") : pas de passage par soupsieve
+    pairs = ((tag.attrs.get("name"), tag.attrs.get("value")) for tag in form.find_all("input"))
+    return {name: value for name, value in pairs if name is not None and value is not None}
+
+
+# seuls les <form method="post"> (et leur contenu) sont construits par BeautifulSoup :
+# en-tête, navigation et scripts de la page sont ignorés dès le parsing
+_POST_FORM_STRAINER = SoupStrainer("form", attrs={"method": "post"})
+
+
+def _find_post_form(soup: BeautifulSoup) -> Tag:
+    """Return the first <form method="post"> of `soup`, or raise ValueError."""
+    # find() natif de BS4, deux fois plus rapide que select_one('form[method="post"]') :
+    # soupsieve garde déjà le sélecteur compilé en cache, c'est le parcours qui coûte
+    form = soup.find("form", attrs={"method": "post"})
+    if not isinstance(form, Tag):
+        raise ValueError("No <form method='post'> found in the page")
+    return form
 
 
 def extract_form_from_url(
     url: str,
-    headers: dict | None = None,
+    headers: Mapping[str, str] | None = None,
     backend: str = "requests",
-    session: requests.Session | HTMLSession | None = None,
+    session: requests.Session | HTMLSession | Page | None = None,
     timeout: TimeoutType = 30,
+    cache: str | os.PathLike[str] | None = None,
 ) -> dict[str, str]:
     """
     Fetches a page and extracts(name: value) pairs from form[method="post"]
@@ -351,9 +1795,13 @@ def extract_form_from_url(
         url(str): URL of the page containing the form.
         headers(dict | None, optional): HTTP headers to include in the request.
         backend(str, optional): Backend used by `make_soup` ("requests", "playwright", etc.).
-        session(requests.Session | HTMLSession | None, optional):
-            HTTP session(e.g., requests.Session) to preserve cookies and tokens.
+        session(requests.Session | HTMLSession | Page | None, optional):
+            HTTP session(e.g., requests.Session) to preserve cookies and tokens,
+            or a playwright Page with backend="playwright".
         timeout(int, optional): Maximum timeout in seconds for the GET request(default 30).
+        cache(str | os.PathLike | None, optional): SQLite file of a persistent HTTP
+            cache (extra "cache"), see `make_soup`. Only for the "requests" backend
+            without `session`.
 
     Returns:
         dict[str, str]: Dictionary {name: value} extracted from the form fields.
@@ -362,25 +1810,34 @@ def extract_form_from_url(
         ValueError: If no ` < form method = "post" > ` is found in the page.
 
     Notes:
-        - Uses `make_soup` to fetch and parse the page.
+        - Uses `make_soup` to fetch and parse the page; only the post forms
+          are built (`parse_only`), the rest of the page is skipped.
         - If a session is provided, it is used for the GET request.
         - The same session can be reused for the login POST request.
+        - The result itself is not memoized: the fields (CSRF token) belong to the
+          session cookies of the GET. Repeated calls are saved at the HTTP level
+          (shared session cache, `cache`), as far as the page's Cache-Control allows.
     """
-
-    soup = make_soup(url, headers=headers, backend=backend, session=session, timeout=timeout)
-    form = soup.select_one('form[method="post"]')
-    if form is None:
-        raise ValueError("No <form method='post'> found in the page")
-    return extract_form(form)
+    soup = make_soup(
+        url,
+        headers=headers,
+        backend=backend,
+        session=session,
+        timeout=timeout,
+        parse_only=_POST_FORM_STRAINER,
+        cache=cache,
+    )
+    return extract_form(_find_post_form(soup))
 
 
 async def aextract_form_from_url(
     url: str,
     *,
-    headers: dict | None = None,
+    headers: Mapping[str, str] | None = None,
     backend: str = "aiohttp",
     session: aiohttp.ClientSession | AsyncHTMLSession | HTMLSession | None = None,
     timeout: TimeoutType = 30,
+    cache: str | os.PathLike[str] | None = None,
 ) -> dict:
     """
     Asynchronous version of extract_form_from_url. Fetches a login page, selects the first
@@ -394,6 +1851,9 @@ async def aextract_form_from_url(
             HTTP session (e.g., aiohttp.ClientSession) to preserve cookies and tokens.
         timeout (int or float optional):
             Maximum timeout in seconds for the GET request (default 30).
+        cache (str | os.PathLike | None, optional): SQLite file of a persistent HTTP
+            cache (extra "cache"), see `amake_soup`. Only for the "aiohttp" backend
+            without `session`.
 
     Returns:
         dict[str, str]: Dictionary {name: value} of the form fields.
@@ -402,38 +1862,72 @@ async def aextract_form_from_url(
         ValueError: If no `<form method="post">` is found in the page.
 
     Notes:
-        - Uses `amake_soup` to fetch and parse the page asynchronously.
+        - Uses `amake_soup` to fetch and parse the page asynchronously; only
+          the post forms are built (`parse_only`).
         - If a session is provided, it is used for the GET request.
         - The same session can be reused for the login POST request.
     """
-    soup = await amake_soup(url, headers=headers, backend=backend, session=session, timeout=timeout)
-    form = soup.select_one('form[method="post"]')
-    if form is None:
-        raise ValueError("No <form method='post'> found in the page")
-    return extract_form(form)
+    soup = await amake_soup(
+        url,
+        headers=headers,
+        backend=backend,
+        session=session,
+        timeout=timeout,
+        parse_only=_POST_FORM_STRAINER,
+        cache=cache,
+    )
+    return extract_form(_find_post_form(soup))
+
+
+# verdicts de is_dynamic / ais_dynamic : (url, en-têtes, seuil) -> bool
+_DYNAMIC_CACHE = _TTLCache(maxsize=1024, ttl=600)
+
+
+def _visible_text_length(markup: str | bytes, encoding: str | None = None) -> int:
+    """
+    Length of the visible text of a page, like `len(soup.text)` but without BeautifulSoup.
+
+    Text of <script>, <style> and <template> is left out, as BeautifulSoup does.
+    Uses selectolax when installed, otherwise an lxml tree (both parse in C).
+    """
+    if _HAS_SELECTOLAX:
+        if isinstance(markup, bytes) and encoding:
+            markup = markup.decode(encoding, errors="replace")
+        tree = get_selectolax()(markup)
+        tree.strip_tags(["script", "style", "template"])
+        return len(tree.text())
+    from lxml import etree
+
+    root = tree_from_text(markup, encoding=encoding)
+    etree.strip_elements(root, "script", "style", "template", with_tail=False)
+    return len(root.text_content())
 
 
 def which_backend(
     url: str,
     *,
-    headers: dict | None = None,
+    headers: Mapping[str, str] | None = None,
     timeout_req: int = 8,
     timeout_pw: int = 20,
     threshold_ratio: float = 1.2,
 ) -> None:
     """
-    Compare la longueur du texte visible (soup.text) obtenu via make_soup
+    Compare la longueur du texte visible (équivalent de soup.text) obtenu
     avec backend="requests" et backend="playwright".
     """
     # requests
-    soup_req = make_soup(url, backend="requests", headers=headers, timeout=timeout_req)
-    len_req_text = len(soup_req.text)
+    len_req_text = _visible_text_length(
+        *_fetch_markup(url, backend="requests", headers=headers, timeout=timeout_req)
+    )
     print("=== requests ===")
     print(f"Longueur HTML (requests): {len_req_text}")
 
     # playwright
-    soup_pw = make_soup(url, backend="playwright", headers=headers, timeout=timeout_pw)
-    len_pw_text = len(soup_pw.text)
+    len_pw_text = _visible_text_length(
+        *_fetch_markup(
+            url, backend="playwright", headers=headers, timeout=timeout_pw, wait_until="load"
+        )
+    )
     print("=== playwright ===")
     print(f"Longueur HTML (playwright): {len_pw_text}")
 
@@ -447,7 +1941,7 @@ def which_backend(
 
 def is_dynamic(
     url: str,
-    headers: dict | None = None,
+    headers: Mapping[str, str] | None = None,
     threshold_ratio: float = 1.2,
     timeout_req: int = 30,
     timeout_pw: int = 60,
@@ -455,10 +1949,11 @@ def is_dynamic(
     """
     Détecte si une page web est dynamique (nécessite Playwright) ou statique (requests suffit).
 
-    La logique repose sur `make_soup` :
-    - On construit une BeautifulSoup avec backend="requests".
-    - On construit une BeautifulSoup avec backend="playwright".
-    - On compare la longueur du texte visible (`soup.text`) des deux résultats.
+    La logique repose sur les backends de `make_soup` :
+    - On récupère la page avec backend="requests" et, en même temps,
+      avec backend="playwright".
+    - On compare la longueur du texte visible (l'équivalent de `soup.text`,
+      mesuré avec selectolax ou lxml, sans construire de BeautifulSoup).
 
     Paramètres
     ----------
@@ -482,6 +1977,12 @@ def is_dynamic(
         True si la page est dynamique (Playwright recommandé).
         False si la page est statique (requests suffit).
 
+    Notes
+    -----
+    Le verdict est gardé en mémoire 10 minutes par (url, headers, threshold_ratio),
+    cache partagé avec `ais_dynamic` : `choose_backend` sur une URL déjà testée
+    ne refait aucune requête.
+
     Exemple
     -------
     >>> is_dynamic("https://fr.wikipedia.org/wiki/Iron_Man")
@@ -489,17 +1990,78 @@ def is_dynamic(
     >>> is_dynamic("https://x.com/")
     True
     """
-    soup_req = make_soup(url, backend="requests", headers=headers, timeout=timeout_req)
-    soup_pw = make_soup(url, backend="playwright", headers=headers, timeout=timeout_pw)
+    key = (*_cache_key(url, headers), threshold_ratio)
+    cached: bool | None = _DYNAMIC_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # les deux téléchargements en parallèle : requests dans un thread, Playwright
+    # dans le sien (le thread appelant ne fait qu'attendre)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        req = pool.submit(
+            _fetch_markup, url, backend="requests", headers=headers, timeout=timeout_req
+        )
+        # "load" : la page doit avoir fini de construire son contenu pour être comparée
+        pw_markup = _fetch_markup(
+            url, backend="playwright", headers=headers, timeout=timeout_pw, wait_until="load"
+        )
+        req_markup = req.result()
+
+    # seule la longueur du texte compte : pas besoin d'arbre BeautifulSoup
+    len_req = _visible_text_length(*req_markup)
+    len_pw = _visible_text_length(*pw_markup)
+
+    ratio = (len_pw + 1) / (len_req + 1)
+    _DYNAMIC_CACHE.set(key, ratio > threshold_ratio)
+    return ratio > threshold_ratio
+
+
+async def ais_dynamic(
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    threshold_ratio: float = 1.2,
+    timeout_req: int = 30,
+    timeout_pw: int = 60,
+) -> bool:
+    """
+    Version asynchrone de `is_dynamic`.
 
-    len_req = len(soup_req.text)
-    len_pw = len(soup_pw.text)
+    La page est récupérée en même temps avec aiohttp et avec Playwright
+    (`asyncio.gather`) : la durée totale est celle du plus lent des deux,
+    pas leur somme. Mêmes paramètres, même retour et même cache que `is_dynamic`.
+
+    Exemple
+    -------
+    >>> urls = ["https://fr.wikipedia.org/wiki/Iron_Man", "https://x.com/"]
+    >>> await asyncio.gather(*(ais_dynamic(u) for u in urls))
+    [False, True]
+    """
+    key = (*_cache_key(url, headers), threshold_ratio)
+    cached: bool | None = _DYNAMIC_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    (req_markup, req_enc), (pw_markup, pw_enc) = await asyncio.gather(
+        _afetch_markup(url, backend="aiohttp", headers=headers, timeout=timeout_req),
+        _afetch_markup(
+            url, backend="playwright", headers=headers, timeout=timeout_pw, wait_until="load"
+        ),
+    )
+    len_req, len_pw = await asyncio.gather(
+        asyncio.to_thread(_visible_text_length, req_markup, req_enc),
+        asyncio.to_thread(_visible_text_length, pw_markup, pw_enc),
+    )
 
     ratio = (len_pw + 1) / (len_req + 1)
+    _DYNAMIC_CACHE.set(key, ratio > threshold_ratio)
     return ratio > threshold_ratio
 
 
-def choose_backend(url: str, headers: dict | None = None, threshold_ratio: float = 1.2) -> str:
+def choose_backend(
+    url: str,
+    headers: Mapping[str, str] | None = None,
+    threshold_ratio: float = 1.2,
+) -> str:
     """
     Choisit automatiquement le backend à utiliser pour parser une page web.
 
@@ -557,10 +2119,91 @@ def choose_backend(url: str, headers: dict | None = None, threshold_ratio: float
     )
 
 
+async def achoose_backend(
+    url: str, headers: Mapping[str, str] | None = None, threshold_ratio: float = 1.2
+) -> str:
+    """
+    Version asynchrone de `choose_backend` (s'appuie sur `ais_dynamic`).
+
+    Retour
+    ------
+    str
+        "aiohttp" si la page est statique, "playwright" si elle est dynamique :
+        des backends de `amake_soup`.
+    """
+    dynamic = await ais_dynamic(url, headers=headers, threshold_ratio=threshold_ratio)
+    return "playwright" if dynamic else "aiohttp"
+
+
+async def amake_soup_batch(
+    urls: list[str],
+    *,
+    headers: Mapping[str, str] | None = None,
+    max_concurrency: int = 10,
+    threshold_ratio: float = 1.2,
+) -> list[Any]:
+    """
+    Choisit le backend de chaque URL puis la récupère, toutes les URLs en parallèle.
+
+    Équivalent concurrent de la boucle
+    `for url in urls: make_soup(url, backend=choose_backend(url))`.
+
+    Paramètres
+    ----------
+    urls : list[str]
+        URLs des pages à récupérer.
+    headers : dict | None
+        En-têtes HTTP optionnels (ex. User-Agent).
+    max_concurrency : int, optionnel
+        Nombre maximal d'URLs traitées en même temps (par défaut 10), pour ne
+        pas saturer le DNS ni se faire limiter par les serveurs.
+    threshold_ratio : float, optionnel
+        Seuil transmis à `achoose_backend`.
+
+    Retour
+    ------
+    list
+        Une BeautifulSoup par URL, dans l'ordre de `urls` ; l'exception levée
+        à la place de la soupe pour une URL en échec.
+    """
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def _one(url: str) -> BeautifulSoup:
+        async with sem:
+            backend = await achoose_backend(url, headers=headers, threshold_ratio=threshold_ratio)
+            return await amake_soup(url, backend=backend, headers=headers)
+
+    return list(await asyncio.gather(*(_one(u) for u in urls), return_exceptions=True))
+
+
 ######################################################################################
 # LEGACY
 ######################################################################################
 
+# fonctions obsolètes déjà signalées : un seul avertissement par processus
+_WARNED: set[str] = set()
+
+
+def _warn_deprecated(
+    name: str, replacement: str = "make_soup ou amake_soup", stacklevel: int = 3
+) -> None:
+    """Emit the DeprecationWarning of a legacy feature, only on its first use."""
+    if name in _WARNED:
+        return
+    _WARNED.add(name)
+    warnings.warn(
+        f"{name} est obsolète, utilisez {replacement}",
+        DeprecationWarning,
+        stacklevel=stacklevel,
+    )
+
+
+async def _legacy_soup(name: str, url: str, parser: str) -> BeautifulSoup:
+    """Shared body of the get_soup_* functions: warn once, then delegate to `amake_soup`."""
+    _warn_deprecated(name, stacklevel=4)
+    # session aiohttp partagée (pool, keep-alive), qui porte déjà DEFAULT_HEADERS
+    return await amake_soup(url, parser=parser, timeout=3, ssl=False)
+
 
 async def get_soup_lxml(url: str) -> BeautifulSoup:
     """Return a BeautifulSoup soup from given url, Parser is lxml.
@@ -572,23 +2215,11 @@ async def get_soup_lxml(url: str) -> BeautifulSoup:
         BeautifulSoup: soup
 
     """
-    warnings.warn(
-        "get_soup_lxml est obsolète, utilisez make_soup ou amake_soup",
-        DeprecationWarning,
-        stacklevel=2,
-    )
-
-    # get HTML page with async GET request
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            url, timeout=aiohttp.ClientTimeout(total=3), ssl=False, headers=headers
-        ) as resp:
-            text = await resp.text()
-    return BeautifulSoup(text, "lxml")
+    return await _legacy_soup("get_soup_lxml", url, "lxml")
 
 
 async def get_soup_html(url: str) -> BeautifulSoup:
-    """Return a BeautifulSoup soup from given url, Parser is html.parser.
+    """Return a BeautifulSoup soup from given url, Parser is lxml (html.parser without lxml).
 
     Args:
         url (str): url
@@ -597,17 +2228,7 @@ async def get_soup_html(url: str) -> BeautifulSoup:
         BeautifulSoup: soup
 
     """
-    warnings.warn(
-        "get_soup_html est obsolète, utilisez make_soup ou amake_soup",
-        DeprecationWarning,
-        stacklevel=2,
-    )
-    # get HTML page with async GET request
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=3), ssl=False) as resp:
-            text = await resp.text()
-    # BeautifulSoup will transform raw HTML in a tree easy to parse
-    return BeautifulSoup(text, features="html.parser")
+    return await _legacy_soup("get_soup_html", url, _DEFAULT_PARSER)
 
 
 async def get_soup_xml(url: str) -> BeautifulSoup:
@@ -620,54 +2241,37 @@ async def get_soup_xml(url: str) -> BeautifulSoup:
         BeautifulSoup: soup
 
     """
-    warnings.warn(
-        "get_soup_xml est obsolète, utilisez make_soup ou amake_soup",
-        DeprecationWarning,
-        stacklevel=2,
-    )
-    asession = AsyncHTMLSession()
-    r: HTMLResponse = await asession.get(url, headers=headers, timeout=3)  # type: ignore
-    return BeautifulSoup(r.text, "xml")
+    # "xml" = builder lxml de BS4, sans requests_html
+    return await _legacy_soup("get_soup_xml", url, "xml")
 
 
 if __name__ == "__main__":
+    # Playwright : User-Agent seul, comme un navigateur (Accept / Accept-Encoding de
+    # DEFAULT_HEADERS seraient imposés à chaque ressource, images et scripts compris)
+    PW_HEADERS = {"User-Agent": DEFAULT_HEADERS["User-Agent"]}
 
     def test_make_soup_ironman() -> None:
         url = "https://fr.wikipedia.org/wiki/Iron_Man"
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0 Safari/537.36"
-            )
-        }
 
         print("=== Test sync make_soup (requests) ===")
-        soup = make_soup(url, backend="requests", headers=headers)
+        soup = make_soup(url, backend="requests", headers=DEFAULT_HEADERS)
         print("Titre:", soup.find("h1").text)  # type: ignore
         print("Premier paragraphe:", soup.find("p").text)  # type: ignore
 
         print("=== Test sync make_soup (playwright) ===")
-        soup_pw = make_soup(url, backend="playwright", headers=headers, timeout=15000)
+        soup_pw = make_soup(url, backend="playwright", headers=PW_HEADERS, timeout=15000)
         print("Titre (playwright):", soup_pw.find("h1").text)  # type: ignore
         print("Premier paragraphe (playwright):", soup_pw.find("p").text)  # type: ignore
 
     def test_make_soup_airbnb() -> None:
         url = "https://www.airbnb.com/"
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0 Safari/537.36"
-            )
-        }
 
         print("=== Test sync make_soup (requests) ===")
-        soup = make_soup(url, backend="requests", headers=headers, timeout=10)
+        soup = make_soup(url, backend="requests", headers=DEFAULT_HEADERS, timeout=10)
         print("Contenu brut (requests):", soup.find("div"))
 
         print("=== Test sync make_soup (playwright) ===")
-        soup_pw = make_soup(url, backend="playwright", headers=headers, timeout=15)
+        soup_pw = make_soup(url, backend="playwright", headers=PW_HEADERS, timeout=15)
         print("Contenu rendu (playwright):", soup_pw.find("div"))
 
     def test_make_soup_dynamic() -> None:
@@ -683,20 +2287,13 @@ if __name__ == "__main__":
     def test_make_soup_twitter() -> None:
         print("----------TEST TWITTER-------------")
         url = "https://x.com/"
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/120.0 Safari/537.36"
-            )
-        }
 
         print("=== requests ===")
-        soup_req = make_soup(url, backend="requests", headers=headers, timeout=10)
+        soup_req = make_soup(url, backend="requests", headers=DEFAULT_HEADERS, timeout=10)
         print("Longueur HTML (requests):", len(soup_req.text))
 
         print("\n=== playwright ===")
-        soup_pw = make_soup(url, backend="playwright", headers=headers, timeout=20)
+        soup_pw = make_soup(url, backend="playwright", headers=PW_HEADERS, timeout=20)
         print("Longueur HTML (playwright):", len(soup_pw.text))
 
     test_make_soup_ironman()
@@ -704,20 +2301,8 @@ if __name__ == "__main__":
     test_make_soup_dynamic()
     test_make_soup_twitter()
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0 Safari/537.36"
-    }
-
-    DEFAULT_UA = (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0.0.0 Safari/537.36"
-    )
-
-    which_backend("https://fr.wikipedia.org/wiki/Iron_Man", headers=headers)
-    which_backend("https://x.com/", headers=headers)
+    which_backend("https://fr.wikipedia.org/wiki/Iron_Man", headers=PW_HEADERS)
+    which_backend("https://x.com/", headers=PW_HEADERS)
 
     # Liste d'URLs à tester
     urls_expected = {
@@ -728,28 +2313,26 @@ if __name__ == "__main__":
 
     # Boucle de test
     for url, expected in urls_expected.items():
-        result = is_dynamic(url, headers=headers, threshold_ratio=1.2)
+        result = is_dynamic(url, headers=PW_HEADERS, threshold_ratio=1.2)
         verdict = "⚠️ Dynamique (Playwright)" if result else "✅ Statique (Requests)"
         print(f"{url} → {verdict}")
         assert result == expected, f"Test échoué pour {url} (attendu {expected}, obtenu {result})"
 
     print("\nTous les tests sont passés ✅")
 
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0 Safari/537.36"
-        )
-    }
-
     urls = [
         "https://fr.wikipedia.org/wiki/Iron_Man",
         "http://quotes.toscrape.com/js/",
         "https://x.com/",
     ]
 
-    for url in urls:
-        backend = choose_backend(url, headers=headers)
-        soup = make_soup(url, backend=backend, headers=headers)
-        print(f"{url} → backend choisi: {backend}, longueur texte: {len(soup.text)}")
+    async def _demo_batch() -> None:
+        soups = await amake_soup_batch(urls, headers=DEFAULT_HEADERS)
+        for url, soup in zip(urls, soups):
+            if isinstance(soup, BaseException):
+                print(f"{url} → échec: {soup!r}")
+            else:
+                print(f"{url} → longueur texte: {len(soup.text)}")
+        await close_session()
+
+    asyncio.run(_demo_batch())
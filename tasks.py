@@ -4,7 +4,8 @@ import shutil
 import subprocess
 import sys
 import webbrowser
-from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from platform import uname
 
@@ -71,22 +72,23 @@ def mypy(c):
 @task
 def cleantest(c):
     """Clean artifacts like *.pyc, __pycache__, .pytest_cache, etc..."""
-    # Find .pyc or .pyo files and delete them
+    # Single walk: delete *.pyc / *.pyo files, collect cache folders
     exclude = ('venv', '.venv')
-    p = Path('.')
-    genpyc = (i for i in p.rglob('*.pyc') if not str(i.parent).startswith(exclude))
-    genpyo = (i for i in p.rglob('*.pyo') if not str(i.parent).startswith(exclude))
-    artifacts = chain(genpyc, genpyo)
-    for art in artifacts:
-        os.remove(art)
-
-    # Delete caches folders
-    cache1 = p.rglob('__pycache__')
-    cache2 = p.rglob('.pytest_cache')
-    cache3 = p.rglob('.mypy_cache')
-    caches = chain(cache1, cache2, cache3)
-    for cache in caches:
-        shutil.rmtree(cache)
+    cache_names = {'__pycache__', '.pytest_cache', '.mypy_cache'}
+    caches = []
+    for root, dirs, files in os.walk('.'):
+        if root == '.':
+            dirs[:] = [d for d in dirs if not d.startswith(exclude)]
+        for f in files:
+            if f.endswith(('.pyc', '.pyo')):
+                os.remove(os.path.join(root, f))
+        for d in [d for d in dirs if d in cache_names]:
+            caches.append(os.path.join(root, d))
+            dirs.remove(d)  # no need to walk into a folder we delete
+
+    # Delete caches folders (in parallel, rmtree is mostly waiting on the disk)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(partial(shutil.rmtree, ignore_errors=True), caches))
 
     # Delete coverage artifacts
     with contextlib.suppress(FileNotFoundError):
@@ -124,9 +126,14 @@ def clean(c):
 
 
 @task
-def test(c):
-    """Run tests with pytest."""
-    c.run("pytest tests/")
+def test(c, network=False):
+    """Run tests with pytest (offline ones, or the network ones with --network)."""
+    if network:
+        # -n auto : tests répartis sur tous les cœurs (pytest-xdist) ; --dist loadgroup :
+        # les tests d'un même xdist_group (même site) restent sur un seul worker
+        c.run('pytest tests/ -m network -n auto --dist loadgroup')
+    else:
+        c.run("pytest tests/")
 
 
 @task
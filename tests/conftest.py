@@ -0,0 +1,290 @@
+import asyncio
+import itertools
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.util import find_spec
+from pathlib import Path
+from types import MappingProxyType
+from urllib.parse import urlsplit
+
+import aiohttp
+import pytest
+import pytest_asyncio
+import requests
+from bs4 import SoupStrainer
+
+from python_web_tools_sl import soup_helpers
+from python_web_tools_sl.soup_helpers import close_session, soup_from_text
+
+LOGIN_URL = "https://secure.lemonde.fr/sfuser/connexion"
+# copie de la page de LOGIN_URL pour les tests hors ligne (fixture login_html)
+LOGIN_SNAPSHOT = Path(__file__).parent / "fixtures" / "lemonde_login.html"
+FORM_SELECTOR = 'form[method="post"]'
+
+# en-têtes communs des tests, en lecture seule : un test ne peut pas les modifier pour
+# les suivants, et les caches HTTP (clé = URL + en-têtes) voient toujours les mêmes
+HEADERS = MappingProxyType(
+    {
+        "User-Agent": (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/120.0 Safari/537.36"
+        )
+    }
+)
+
+# Playwright est optionnel : ses cas sont ignorés, et non en échec, s'il n'est pas installé
+requires_playwright = pytest.mark.skipif(
+    find_spec("playwright") is None, reason="playwright n'est pas installé"
+)
+# axe "backend" des tests synchrones
+SYNC_BACKENDS = ["requests", pytest.param("playwright", marks=requires_playwright)]
+# backends des tests async, lancés ensemble avec asyncio.gather (httpx est optionnel)
+ASYNC_BACKENDS = ["aiohttp"] + (["httpx"] if find_spec("httpx") is not None else [])
+
+
+# durée de vie du cache HTTP sur disque des tests (extra "cache"), en secondes
+CACHE_EXPIRE = 3600
+
+
+@pytest.fixture(scope="session")
+def http_cache_dir(pytestconfig):
+    """Dossier du cache HTTP des tests, dans .pytest_cache : conservé d'une exécution à l'autre."""
+    return pytestconfig.cache.mkdir("http")
+
+
+@pytest.fixture(scope="session")
+def cached_session(http_cache_dir):
+    """requests.Session avec cache disque (requests-cache), sans cache si l'extra manque.
+
+    Le Cache-Control des sites est ignoré : les tests ne lisent que des champs stables
+    (csrf, signin), une réponse d'il y a moins d'une heure fait l'affaire.
+    """
+    try:
+        import requests_cache
+    except ImportError:
+        session = requests.Session()
+    else:
+        session = requests_cache.CachedSession(
+            str(http_cache_dir / "requests"),
+            expire_after=CACHE_EXPIRE,
+            allowable_methods=["GET"],
+        )
+    session.headers.update(HEADERS)
+    with session:
+        yield session
+
+
+# délai minimal entre deux requêtes vers le même hôte, pour ne pas se faire bloquer
+MIN_INTERVAL = 2
+
+
+def _reserve_slot(slots, url):
+    """Réserve le prochain créneau libre pour l'hôte de `url` ; renvoie l'attente en secondes."""
+    host = urlsplit(url).netloc or url
+    now = time.monotonic()
+    start = max(now, slots.get(host, float("-inf")) + MIN_INTERVAL)
+    # le créneau est pris avant d'attendre : deux appels concurrents ne partent pas ensemble
+    slots[host] = start
+    return start - now
+
+
+@pytest.fixture(scope="session")
+def host_slots():
+    """Heure (time.monotonic) de la dernière requête prévue, par hôte."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def host_rate_limit(host_slots):
+    """Avant une requête vers l'hôte de `url`, attend MIN_INTERVAL depuis la précédente.
+
+    Remplace les pauses fixes après chaque test : on n'attend que si le même hôte
+    vient d'être sollicité, jamais pour un test qui ne fait pas de requête.
+    """
+
+    def wait(url):
+        delay = _reserve_slot(host_slots, url)
+        if delay > 0:
+            time.sleep(delay)
+
+    return wait
+
+
+@pytest.fixture(scope="session")
+def ahost_rate_limit(host_slots):
+    """Version async de `host_rate_limit` (mêmes créneaux), à attendre avec `await`.
+
+    L'attente laisse tourner la boucle, et des appels lancés ensemble (asyncio.gather)
+    reçoivent des créneaux successifs au lieu de partir en même temps.
+    """
+
+    async def wait(url):
+        delay = _reserve_slot(host_slots, url)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    return wait
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    """Sert les pages déclarées par les tests (`LocalServer.page`), avec ETag / 304."""
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        self.server.hits[path] += 1
+        page = self.server.pages.get(path)
+        if page is None:
+            self.send_error(404)
+            return
+        body, headers, delay = page
+        # page lente : réponse retardée (tests de timeout)
+        time.sleep(delay)
+        etag = headers.get("ETag")
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # pas de journal des requêtes sur stderr pendant les tests
+        pass
+
+
+class LocalServer:
+    """Serveur HTTP local (un thread) : les tests hors ligne y déclarent leurs pages."""
+
+    def __init__(self):
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.pages = {}
+        self.httpd.hits = Counter()
+        self._ids = itertools.count()
+
+    def page(self, body, content_type="text/html", headers=None, delay=0):
+        """Publie `body` (bytes) sous une URL neuve, servie après `delay` s, et la renvoie."""
+        url = f"http://127.0.0.1:{self.httpd.server_port}/page{next(self._ids)}.html"
+        self.replace(url, body, content_type, headers, delay)
+        return url
+
+    def replace(self, url, body, content_type="text/html", headers=None, delay=0):
+        """Remplace la page servie à `url` (contenu, en-têtes et délai)."""
+        headers = {"Content-Type": content_type, **(headers or {})}
+        self.httpd.pages[urlsplit(url).path] = (body, headers, delay)
+
+    def hits(self, url):
+        """Nombre de requêtes reçues pour `url`."""
+        return self.httpd.hits[urlsplit(url).path]
+
+
+@pytest.fixture(scope="session")
+def local_server():
+    """Serveur HTTP local partagé par les tests hors ligne (aucun accès à Internet)."""
+    server = LocalServer()
+    thread = threading.Thread(target=server.httpd.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.httpd.shutdown()
+    server.httpd.server_close()
+
+
+@pytest_asyncio.fixture
+async def shared_sessions():
+    """Ferme en fin de test les sessions async partagées de soup_helpers (aiohttp, httpx...).
+
+    Elles sont liées à la boucle du test : sans cela, aiohttp signale une session non fermée.
+    """
+    yield
+    await close_session()
+
+
+@pytest.fixture(autouse=True)
+def clear_soup_caches():
+    """Vide les caches en mémoire de soup_helpers : chaque test part d'un état neuf."""
+    for cache in (
+        soup_helpers._RESPONSE_CACHE,
+        soup_helpers._HOST_ENCODINGS,
+        soup_helpers._DYNAMIC_CACHE,
+    ):
+        cache.clear()
+
+
+@pytest.fixture(scope="session")
+def login_html():
+    """HTML de la page de connexion, lu dans la copie enregistrée (aucune requête)."""
+    return LOGIN_SNAPSHOT.read_text(encoding="utf-8")
+
+
+@pytest.fixture(scope="session")
+def login_soup(login_html):
+    """Soup de la page de connexion, parsée une seule fois (ne pas la modifier dans un test)."""
+    return soup_from_text(login_html)
+
+
+@pytest.fixture(scope="session")
+def login_form(login_html):
+    """Formulaire de connexion seul : le reste de la page n'est pas construit (SoupStrainer)."""
+    strainer = SoupStrainer("form", attrs={"method": "post"})
+    return soup_from_text(login_html, parse_only=strainer).find("form")
+
+
+@pytest.fixture
+def pw_page():
+    """Page Playwright de l'appelant, passée à `make_soup(..., session=page)`.
+
+    Une page fournie est pilotée dans le thread du test : elle a donc son propre
+    Playwright, arrêté en fin de test (sa boucle asyncio est alors libérée).
+    """
+    sync_api = pytest.importorskip("playwright.sync_api")
+    with sync_api.sync_playwright() as pw:
+        browser = pw.chromium.launch(headless=True)
+        context = browser.new_context(extra_http_headers=dict(HEADERS))
+        yield context.new_page()
+        browser.close()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_session(http_cache_dir):
+    """Session aiohttp partagée par les tests async (pool de connexions, TLS déjà négocié).
+
+    Avec cache disque (aiohttp-client-cache) si l'extra "cache" est installé, comme
+    `cached_session`. Les tests qui l'utilisent doivent tourner dans la boucle de la
+    session : `@pytest.mark.asyncio(loop_scope="session")`.
+    """
+    timeout = aiohttp.ClientTimeout(total=120)
+    try:
+        from aiohttp_client_cache import CachedSession, SQLiteBackend
+    except ImportError:
+        session = aiohttp.ClientSession(headers=HEADERS, timeout=timeout)
+    else:
+        session = CachedSession(
+            cache=SQLiteBackend(str(http_cache_dir / "aiohttp"), expire_after=CACHE_EXPIRE),
+            headers=HEADERS,
+            timeout=timeout,
+        )
+    async with session:
+        yield session
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def httpx_client():
+    """httpx.AsyncClient partagé par les tests async, fermé en fin de session (None sans httpx).
+
+    Comme `http_session`, à utiliser dans la boucle de la session.
+    """
+    if find_spec("httpx") is None:
+        yield None
+        return
+    import httpx
+
+    async with httpx.AsyncClient(headers=dict(HEADERS), timeout=120) as client:
+        yield client
@@ -1,13 +1,20 @@
+import asyncio
+import time
+
 import pytest
 
-from python_tools_sl.decorators.pauses import with_pause_async
-from python_web_tools_sl.soup_helpers import amake_soup
+from python_web_tools_sl import soup_helpers
+from python_web_tools_sl.soup_helpers import amake_soup, amake_tree, close_session
+
+from .conftest import HEADERS, requires_playwright
 
 
+@pytest.mark.network
+@pytest.mark.xdist_group("quotes")
 @pytest.mark.asyncio
-@with_pause_async(2, message="pause async de 2 secondes pour souffler")
-async def test_quotes_aiohttp():
+async def test_quotes_aiohttp(ahost_rate_limit):
     url = "http://quotes.toscrape.com/"
+    await ahost_rate_limit(url)
     soup = await amake_soup(url, backend="aiohttp", timeout=10)
 
     # Vérifie que la soup n'est pas vide
@@ -18,28 +25,27 @@ async def test_quotes_aiohttp():
     assert len(soup.text) > 1000
 
 
+@pytest.mark.network
+@pytest.mark.xdist_group("quotes")
+@requires_playwright
 @pytest.mark.asyncio
-@with_pause_async(2, message="pause async de 2 secondes pour souffler")
-async def test_quotes_playwright():
+async def test_quotes_playwright(ahost_rate_limit):
     url = "http://quotes.toscrape.com/js/"
+    await ahost_rate_limit(url)
     soup = await amake_soup(url, backend="playwright", timeout=20)
     assert soup is not None
     assert "Quotes" in soup.text
     assert len(soup.text) > 1000
 
 
+@pytest.mark.network
+@pytest.mark.xdist_group("wikipedia")
+@requires_playwright
 @pytest.mark.asyncio
-@with_pause_async(2, message="pause async de 2 secondes pour souffler")
-async def test_wikipedia_playwright():
+async def test_wikipedia_playwright(ahost_rate_limit):
     url = "https://fr.wikipedia.org/wiki/Iron_Man"
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0 Safari/537.36"
-        )
-    }
-    soup = await amake_soup(url, backend="playwright", headers=headers, timeout=20)
+    await ahost_rate_limit(url)
+    soup = await amake_soup(url, backend="playwright", headers=HEADERS, timeout=20)
 
     # Vérifie que la soup n'est pas vide
     assert soup is not None
@@ -47,3 +53,94 @@ async def test_wikipedia_playwright():
     assert "Iron Man" in soup.text
     # Vérifie que la longueur du texte est cohérente
     assert len(soup.text) > 4000
+
+
+# pages servies en local (fixture local_server) : charset annoncé dans l'en-tête HTTP seulement
+@pytest.mark.asyncio
+async def test_amake_soup_latin_1_charset(local_server, shared_sessions):
+    # "latin-1" : alias Python inconnu de libxml2
+    french = "Où est la gare ? Déjà l'été, à bientôt."
+    url = local_server.page(
+        f"<html><body><p>{french}</p></body></html>".encode("latin-1"),
+        content_type="text/html; charset=latin-1",
+    )
+    soup = await amake_soup(url)
+    assert soup.p.text == french
+
+
+@pytest.mark.asyncio
+async def test_amake_soup_euc_jp_charset(local_server, shared_sessions):
+    url = local_server.page(
+        "<html><body><p>日本語のページ</p></body></html>".encode("euc-jp"),
+        content_type="text/html; charset=EUC-JP",
+    )
+    soup = await amake_soup(url)
+    assert soup.p.text == "日本語のページ"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("charset", ["latin-1", "utf8mb4", "x-user-defined"])
+async def test_amake_tree_charset_unknown_to_lxml(local_server, shared_sessions, charset):
+    # corps lu en flux par lxml : le charset annoncé ne doit pas le faire échouer
+    body = '<html><head><meta charset="iso-8859-1"></head><body><p>café</p></body></html>'
+    url = local_server.page(body.encode("latin-1"), content_type=f"text/html; charset={charset}")
+    tree = await amake_tree(url)
+    assert tree.findtext(".//p") == "café"
+
+
+@pytest.mark.asyncio
+async def test_amake_tree_streams_aiohttp_body(local_server, shared_sessions):
+    url = local_server.page(
+        b'<html><body><form method="post"><input name="csrf" value="abc"></form></body></html>'
+    )
+    tree = await amake_tree(url)
+    assert tree.xpath("//input/@value") == ["abc"]
+
+
+@pytest.mark.asyncio
+async def test_amake_soup_fresh_max_age_skips_request(local_server, shared_sessions):
+    url = local_server.page(
+        b"<html><body><p>frais</p></body></html>", headers={"Cache-Control": "max-age=60"}
+    )
+    assert (await amake_soup(url)).p.text == "frais"
+    assert (await amake_soup(url)).p.text == "frais"
+    assert local_server.hits(url) == 1
+
+
+@pytest.mark.asyncio
+async def test_amake_soup_cache_honours_timeout(local_server, shared_sessions, tmp_path):
+    # `cache=` passe par une session aiohttp-client-cache : le délai doit s'y appliquer aussi
+    pytest.importorskip("aiohttp_client_cache")
+    url = local_server.page(b"<html><body><p>lente</p></body></html>", delay=3)
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        await amake_soup(url, timeout=1, cache=tmp_path / "http_cache")
+    assert time.monotonic() - start < 2.5
+
+
+def test_shared_session_of_another_loop_is_dropped_with_warning():
+    # session partagée créée dans une boucle qui reste ouverte, puis vue depuis une autre
+    loop = asyncio.new_event_loop()
+    session = loop.run_until_complete(soup_helpers._get_session())
+
+    async def replace_then_close():
+        with pytest.warns(RuntimeWarning, match="autre boucle"):
+            replaced = await soup_helpers._get_session()
+        await close_session()
+        return replaced
+
+    try:
+        replaced = asyncio.run(replace_then_close())
+        assert replaced is not session and replaced.closed
+        # l'ancienne session n'a pas été fermée depuis la mauvaise boucle
+        assert not session.closed
+
+        soup_helpers._AIOHTTP_SESSION = session
+        soup_helpers._AIOHTTP_SESSION_LOOP = loop
+        with pytest.warns(RuntimeWarning, match="autre boucle"):
+            asyncio.run(close_session())
+        assert soup_helpers._AIOHTTP_SESSION is None
+        assert not session.closed
+    finally:
+        loop.run_until_complete(session.close())
+        loop.close()
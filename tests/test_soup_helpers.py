@@ -1,73 +1,309 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+import requests
 
-from python_tools_sl.decorators.pauses import with_pause
-from python_web_tools_sl.soup_helpers import choose_backend, is_dynamic, make_soup
+from python_web_tools_sl import soup_helpers
+from python_web_tools_sl.soup_helpers import (
+    _TTLCache,
+    choose_backend,
+    is_dynamic,
+    make_soup,
+    make_tree,
+)
 
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0 Safari/537.36"
-    )
-}
+from .conftest import HEADERS, SYNC_BACKENDS, requires_playwright
 
 
-@with_pause(2, message="pause après chaque test backend")
-@pytest.mark.parametrize("backend", ["requests", "playwright"])
-def test_make_soup_wikipedia(backend):
+@pytest.mark.network
+@pytest.mark.xdist_group("wikipedia")
+@pytest.mark.parametrize("backend", SYNC_BACKENDS)
+def test_make_soup_wikipedia(backend, host_rate_limit):
     url = "https://fr.wikipedia.org/wiki/Iron_Man"
+    host_rate_limit(url)
     soup = make_soup(url, backend=backend, headers=HEADERS, timeout=15)
     assert soup is not None
     assert "Iron Man" in soup.text
     assert len(soup.text) > 4000
 
 
-@with_pause(2, message="pause après chaque test backend")
-@pytest.mark.parametrize("backend", ["requests", "playwright"])
-def test_make_soup_airbnb(backend):
+@pytest.mark.network
+@pytest.mark.xdist_group("airbnb")
+@pytest.mark.parametrize("backend", SYNC_BACKENDS)
+def test_make_soup_airbnb(backend, host_rate_limit):
     url = "https://www.airbnb.com/"
+    host_rate_limit(url)
     soup = make_soup(url, backend=backend, headers=HEADERS, timeout=120)
     assert soup is not None
     assert soup.find("div") is not None
 
 
-@with_pause(2, message="pause après chaque test backend")
-@pytest.mark.parametrize("backend", ["requests", "playwright"])
-def test_make_soup_dynamic_coinmarketcap(backend):
+@pytest.mark.network
+@pytest.mark.xdist_group("coinmarketcap")
+@pytest.mark.parametrize("backend", SYNC_BACKENDS)
+def test_make_soup_dynamic_coinmarketcap(backend, host_rate_limit):
     url = "https://coinmarketcap.com/"
+    host_rate_limit(url)
     soup = make_soup(url, backend=backend, headers=HEADERS, timeout=50)
     assert soup is not None
     assert len(soup.text) > 1000
 
 
-@with_pause(2, message="pause après chaque test backend")
-@pytest.mark.parametrize("backend", ["requests", "playwright"])
-def test_make_soup_twitter(backend):
+@pytest.mark.network
+@pytest.mark.xdist_group("x")
+@pytest.mark.parametrize("backend", SYNC_BACKENDS)
+def test_make_soup_twitter(backend, host_rate_limit):
     url = "https://x.com/"
+    host_rate_limit(url)
     soup = make_soup(url, backend=backend, headers=HEADERS, timeout=240)
     assert soup is not None
     assert len(soup.text) > 500
 
 
-@with_pause(2, message="pause après chaque test backend")
-def test_is_dynamic_and_choose_backend():
-    urls_expected = {
-        "https://fr.wikipedia.org/wiki/Iron_Man": False,  # attendu: statique
-        "http://quotes.toscrape.com/js/": True,  # attendu: dynamique
-        "https://x.com/": True,  # attendu: dynamique
-    }
-    for url, expected in urls_expected.items():
-        result = is_dynamic(
-            url,
-            headers=HEADERS,
-            threshold_ratio=1.2,
-            timeout_req=60,
-            timeout_pw=120,
-        )
-        assert result == expected
-
-    for url in urls_expected.keys():
-        backend = choose_backend(url, headers=HEADERS)
-        soup = make_soup(url, backend=backend, timeout=120, headers=HEADERS)
-        assert soup is not None
-        assert len(soup.text) > 500
+@pytest.mark.network
+@requires_playwright
+@pytest.mark.parametrize(
+    "url, expected",
+    [
+        # un cas par site, chacun dans le xdist_group de son hôte (limite de débit)
+        pytest.param(
+            "https://fr.wikipedia.org/wiki/Iron_Man",
+            False,  # attendu: statique
+            marks=pytest.mark.xdist_group("wikipedia"),
+        ),
+        pytest.param(
+            "http://quotes.toscrape.com/js/",
+            True,  # attendu: dynamique
+            marks=pytest.mark.xdist_group("quotes"),
+        ),
+        pytest.param("https://x.com/", True, marks=pytest.mark.xdist_group("x")),
+    ],
+)
+def test_is_dynamic_and_choose_backend(url, expected, host_rate_limit):
+    host_rate_limit(url)
+    result = is_dynamic(
+        url,
+        headers=HEADERS,
+        threshold_ratio=1.2,
+        timeout_req=60,
+        timeout_pw=120,
+    )
+    assert result == expected
+
+    host_rate_limit(url)
+    backend = choose_backend(url, headers=HEADERS)
+    soup = make_soup(url, backend=backend, timeout=120, headers=HEADERS)
+    assert soup is not None
+    assert len(soup.text) > 500
+
+
+# pages servies en local (fixture local_server) : charset annoncé dans l'en-tête HTTP seulement
+JAPANESE = "日本語のページ"
+# assez long pour que la détection automatique se trompe (cp1257, windows-1250...)
+FRENCH = "Où est la gare ? Déjà l'été, à bientôt."
+
+
+def _page(text):
+    return f"<html><body><p>{text}</p></body></html>"
+
+
+def test_make_soup_euc_jp_charset(local_server):
+    url = local_server.page(
+        _page(JAPANESE).encode("euc-jp"), content_type="text/html; charset=EUC-JP"
+    )
+    assert make_soup(url).p.text == JAPANESE
+
+
+def test_make_tree_euc_jp_charset(local_server):
+    url = local_server.page(
+        _page(JAPANESE).encode("euc-jp"), content_type="text/html; charset=euc-jp"
+    )
+    assert make_tree(url).findtext(".//p") == JAPANESE
+
+
+def test_make_soup_latin_1_charset(local_server):
+    # "latin-1" : alias Python inconnu de libxml2
+    url = local_server.page(_page(FRENCH).encode("latin-1"), "text/html; charset=latin-1")
+    assert make_soup(url).p.text == FRENCH
+
+
+def test_make_soup_unknown_charset_is_detected(local_server):
+    # charset inconnu de Python : ignoré, le parser lit le <meta charset>
+    body = f'<html><head><meta charset="utf-8"></head>{_page("été")}'.encode()
+    url = local_server.page(body, "text/html; charset=utf8mb4")
+    assert make_soup(url).p.text == "été"
+
+
+def test_make_soup_explicit_encoding(local_server):
+    # encodage donné par l'appelant (aucun charset HTTP ni <meta>) : utilisé tel quel
+    url = local_server.page(_page(JAPANESE).encode("euc-jp"))
+    assert make_soup(url, encoding="euc-jp").p.text == JAPANESE
+
+
+def test_make_soup_host_hint_with_mixed_encodings(local_server):
+    # deux pages du même hôte sans aucune déclaration, dans deux encodages :
+    # l'encodage de la première ne doit pas être imposé à la seconde
+    utf8_url = local_server.page(_page(FRENCH).encode("utf-8"))
+    cp1252_url = local_server.page(_page(FRENCH).encode("cp1252"))
+
+    assert make_soup(utf8_url).p.text == FRENCH
+    # octets cp1252 invalides en UTF-8 : détectés, pas décodés en U+FFFD
+    assert "�" not in make_soup(cp1252_url).p.text
+    # et dans l'autre sens : la page UTF-8 n'est pas lue avec l'encodage de la précédente
+    assert make_soup(utf8_url).p.text == FRENCH
+
+
+def test_ttl_cache_expiry_and_lru():
+    cache = _TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" devient le plus récent
+    cache.set("c", 3)  # taille max : "b", le moins récent, est évincé
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+    expired = _TTLCache(ttl=-1)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+
+
+def test_make_soup_revalidates_with_etag(local_server):
+    url = local_server.page(
+        _page("v1").encode(), headers={"ETag": '"v1"', "Cache-Control": "no-cache"}
+    )
+    assert make_soup(url).p.text == "v1"
+    # page modifiée sur le serveur, même ETag : le 304 renvoie le contenu déjà reçu
+    local_server.replace(
+        url, _page("v2").encode(), headers={"ETag": '"v1"', "Cache-Control": "no-cache"}
+    )
+    assert make_soup(url).p.text == "v1"
+    assert local_server.hits(url) == 2
+
+
+def test_make_soup_fresh_max_age_skips_request(local_server):
+    url = local_server.page(_page("frais").encode(), headers={"Cache-Control": "max-age=60"})
+    assert make_soup(url).p.text == "frais"
+    assert make_soup(url).p.text == "frais"
+    assert local_server.hits(url) == 1
+
+
+def test_make_soup_no_store_is_not_cached(local_server):
+    url = local_server.page(
+        _page("x").encode(), headers={"ETag": '"x"', "Cache-Control": "no-store"}
+    )
+    make_soup(url)
+    make_soup(url)
+    assert local_server.hits(url) == 2
+
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_make_tree(local_server, stream):
+    url = local_server.page(
+        b'<html><body><form method="post"><input name="csrf" value="abc"></form></body></html>'
+    )
+    tree = make_tree(url, stream=stream)
+    assert tree.tag == "html"
+    assert tree.xpath("//input/@value") == ["abc"]
+
+
+def test_make_soup_read_timeout_not_retried(local_server):
+    url = local_server.page(b"<html><body><p>lente</p></body></html>", delay=3)
+    start = time.monotonic()
+    with pytest.raises(requests.ReadTimeout):
+        make_soup(url, timeout=1)
+    assert time.monotonic() - start < 2.5
+
+
+def test_is_dynamic_is_memoized(local_server, monkeypatch):
+    # Playwright remplacé par une page "rendue" bien plus riche : aucun Chromium lancé
+    renders = []
+
+    def fake_playwright(url, *args):
+        renders.append(url)
+        return _page("contenu construit par JavaScript " * 20), None
+
+    monkeypatch.setitem(soup_helpers._SYNC_BACKENDS, "playwright", fake_playwright)
+    url = local_server.page(_page("coquille").encode())
+
+    assert is_dynamic(url) is True
+    assert is_dynamic(url) is True
+    # second appel : verdict en cache, ni requête ni rendu
+    assert local_server.hits(url) == 1
+    assert renders == [url]
+    # autre seuil : autre clé de cache, nouvelle mesure
+    assert is_dynamic(url, threshold_ratio=100) is False
+    assert local_server.hits(url) == 2
+
+
+class _FakeSyncPlaywright:
+    """Playwright sync factice, avec les contraintes du vrai : il refuse tout autre thread
+    que le sien (greenlet) et garde sa boucle asyncio attachée à ce thread."""
+
+    def __init__(self):
+        self.launches = 0
+        self.stopped = False
+        self.chromium = self
+
+    def start(self):
+        self._thread = threading.get_ident()
+        self._loop = asyncio.new_event_loop()
+        asyncio._set_running_loop(self._loop)
+        return self
+
+    def _check_thread(self):
+        if threading.get_ident() != self._thread:
+            raise RuntimeError("Cannot switch to a different thread")
+
+    def stop(self):
+        self._check_thread()
+        asyncio._set_running_loop(None)
+        self._loop.close()
+        self.stopped = True
+
+    # chromium, navigateur, contexte et page sont tous cet objet
+    def launch(self, headless):
+        self._check_thread()
+        self.launches += 1
+        return self
+
+    def is_connected(self):
+        return True
+
+    def new_context(self, extra_http_headers):
+        self._check_thread()
+        return self
+
+    def new_page(self):
+        self._check_thread()
+        return self
+
+    def goto(self, url, timeout, wait_until):
+        self._check_thread()
+        self.url = url
+
+    def content(self):
+        self._check_thread()
+        return _page(f"rendu de {self.url}")
+
+    def close(self):
+        self._check_thread()
+
+
+def test_make_soup_playwright_any_thread(monkeypatch):
+    fake = _FakeSyncPlaywright()
+    monkeypatch.setattr(soup_helpers, "get_playwright", lambda: lambda: fake)
+    try:
+        assert "rendu de http://a/" in make_soup("http://a/", backend="playwright").text
+        # un autre thread passe par le même navigateur...
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            soup = pool.submit(make_soup, "http://b/", backend="playwright").result()
+        assert "rendu de http://b/" in soup.text
+        # ... et le thread appelant garde sa boucle libre
+        assert asyncio.run(asyncio.sleep(0, result="ok")) == "ok"
+        assert fake.launches == 1
+    finally:
+        soup_helpers.close_playwright()
+    assert fake.stopped
@@ -1,22 +1,20 @@
+import asyncio
+
 import pytest
 
-from python_tools_sl.decorators.pauses import with_pause, with_pause_async
 from python_web_tools_sl.soup_helpers import (  # noqa: F401
     aextract_form_from_url,
     amake_soup,
     extract_form,
     extract_form_from_url,
     extract_name_value_pairs,
+    extract_name_value_pairs_fast,
     make_soup,
+    soup_from_text,
+    tree_from_text,
 )
 
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0 Safari/537.36"
-    )
-}
+from .conftest import ASYNC_BACKENDS, FORM_SELECTOR, HEADERS, LOGIN_URL, SYNC_BACKENDS
 
 
 # def test_select_tag_wikipedia_ironman():
@@ -30,12 +28,9 @@ HEADERS = {
 #     assert "MediaWiki" in tags["generator"]
 
 
-@with_pause(2, message="ouais, pause de 2 secondes pour pas se faire timeout")
-def test_extract_name_value_pairs_syc():
-    LOGIN_URL = "https://secure.lemonde.fr/sfuser/connexion"
-    soup = make_soup(LOGIN_URL, headers=HEADERS, timeout=20)
-    form = soup.select_one('form[method="post"]')
-    payload = extract_name_value_pairs(form, "input")
+def test_extract_name_value_pairs_syc(login_form):
+    # formulaire déjà téléchargé et parsé par la fixture de session (conftest.py)
+    payload = extract_name_value_pairs(login_form, "input")
 
     assert isinstance(payload, dict)
     assert "csrf" in payload
@@ -47,12 +42,70 @@ def test_extract_name_value_pairs_syc():
     assert payload["password"] == "secret"
 
 
-@pytest.mark.asyncio
-@with_pause_async(2, message="pause async de 2 secondes pour souffler")
-async def test_extract_name_value_pairs_async():
-    LOGIN_URL = "https://secure.lemonde.fr/sfuser/connexion"
-    soup = await amake_soup(LOGIN_URL, headers=HEADERS, timeout=120)
-    form = soup.select_one('form[method="post"]')
+def test_extract_form(login_soup):
+    # formulaire post seul : le formulaire de recherche (get) de l'en-tête est ignoré
+    payload = extract_form(login_soup.find("form", attrs={"method": "post"}))
+
+    assert payload["signin"] == "1"
+    assert "csrf" in payload
+    # champs sans value (email, password) et formulaire de recherche absents
+    assert "email" not in payload
+    assert "search_keywords" not in payload
+
+
+def test_extract_name_value_pairs_lxml(login_html):
+    # arbre lxml : XPath compilé (libxml2), mêmes paires que l'arbre BeautifulSoup
+    tree = tree_from_text(login_html)
+    form = tree.xpath('//form[@method="post"]')[0]
+    payload = extract_name_value_pairs(form, "input")
+
+    assert payload == {"csrf": payload["csrf"], "signin": "1", "remember": "on"}
+    assert extract_name_value_pairs(tree, "meta", attr="content") == {}
+
+
+# formulaire qui a lui-même un name : il ne doit jamais faire partie du résultat
+NAMED_FORM = """<html><body>
+<form name="login" action="/login" method="post" value="form">
+  <input type="hidden" name="csrf" value="abc"><input name="email" action="x">
+</form></body></html>"""
+
+
+@pytest.mark.parametrize(
+    ("selector", "attr"), [("input", "value"), ("[name]", "value"), ("*", "action")]
+)
+def test_extract_name_value_pairs_backend_parity(login_html, selector, attr):
+    # même formulaire, même sélecteur : mêmes paires avec BeautifulSoup et avec lxml
+    for html in (login_html, NAMED_FORM):
+        soup_form = soup_from_text(html).find("form", attrs={"method": "post"})
+        tree_form = tree_from_text(html).xpath('//form[@method="post"]')[0]
+        assert extract_name_value_pairs(soup_form, selector, attr) == extract_name_value_pairs(
+            tree_form, selector, attr
+        )
+        # page entière : BeautifulSoup, lxml et selectolax (HTML brut)
+        full = f"{FORM_SELECTOR} {selector}"
+        expected = extract_name_value_pairs(soup_from_text(html), full, attr)
+        assert extract_name_value_pairs(tree_from_text(html), full, attr) == expected
+        assert extract_name_value_pairs_fast(html, full, attr) == expected
+
+
+def test_extract_name_value_pairs_fast(login_html):
+    # selectolax (Lexbor) directement sur le HTML brut, sans arbre BeautifulSoup
+    payload = extract_name_value_pairs_fast(login_html, f"{FORM_SELECTOR} input")
+
+    assert isinstance(payload, dict)
+    assert "csrf" in payload
+    assert "signin" in payload
+
+
+# tests en ligne : tous vers secure.lemonde.fr, donc un seul worker xdist qui respecte
+# host_rate_limit (les tests ci-dessus lisent la copie de la page, sur n'importe quel worker)
+@pytest.mark.network
+@pytest.mark.xdist_group("lemonde")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_extract_name_value_pairs_async(http_session, ahost_rate_limit):
+    await ahost_rate_limit(LOGIN_URL)
+    soup = await amake_soup(LOGIN_URL, session=http_session, timeout=120)
+    form = soup.select_one(FORM_SELECTOR)
     payload = extract_name_value_pairs(form, "input")
 
     assert "csrf" in payload
@@ -62,24 +115,19 @@ async def test_extract_name_value_pairs_async():
     assert payload["password"] == "secret"
 
 
-HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0 Safari/537.36"
-    )
-}
-
-
-@with_pause(2, message="pause après chaque test backend")
-@pytest.mark.parametrize("backend", ["playwright", "requests"])
-def test_extract_form_from_url_with_timeout(backend):
-    LOGIN_URL = "https://secure.lemonde.fr/sfuser/connexion"
-    # Appel avec timeout explicite
+@pytest.mark.network
+@pytest.mark.xdist_group("lemonde")
+@pytest.mark.parametrize("backend", SYNC_BACKENDS)
+def test_extract_form_from_url_with_timeout(backend, request, host_rate_limit):
+    host_rate_limit(LOGIN_URL)
+    # Appel avec timeout explicite ; requests passe par la session avec cache disque,
+    # playwright par une page du navigateur partagé
+    session = request.getfixturevalue("cached_session" if backend == "requests" else "pw_page")
     payload = extract_form_from_url(
         LOGIN_URL,
         headers=HEADERS,
         backend=backend,
+        session=session,
         timeout=120,  # timeout court pour le test
     )
 
@@ -96,26 +144,35 @@ def test_extract_form_from_url_with_timeout(backend):
     assert payload["password"] == "dummy123"
 
 
-@pytest.mark.asyncio
-@with_pause_async(2, message="pause async de 2 secondes pour souffler")
-async def test_aextract_form_from_url_with_timeout():
-    LOGIN_URL = "https://secure.lemonde.fr/sfuser/connexion"
-    # Appel async avec timeout explicite
-    payload = await aextract_form_from_url(
-        LOGIN_URL,
-        headers=HEADERS,
-        backend="aiohttp",
-        timeout=120,  # timeout court pour le test
+@pytest.mark.network
+@pytest.mark.xdist_group("lemonde")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_aextract_form_from_url_with_timeout(http_session, httpx_client, ahost_rate_limit):
+    # chaque backend passe par la session des tests qui lui correspond (fermées par les fixtures)
+    sessions = {"aiohttp": http_session, "httpx": httpx_client}
+    # un seul créneau pour le lot : les backends partent ensuite en même temps
+    await ahost_rate_limit(LOGIN_URL)
+    payloads = await asyncio.gather(
+        *(
+            aextract_form_from_url(
+                LOGIN_URL,
+                session=sessions[backend],
+                backend=backend,
+                timeout=120,  # timeout court pour le test
+            )
+            for backend in ASYNC_BACKENDS
+        )
     )
 
-    # Vérifie que les champs cachés sont présents
-    assert "csrf" in payload
-    assert "signin" in payload
+    for payload in payloads:
+        # Vérifie que les champs cachés sont présents
+        assert "csrf" in payload
+        assert "signin" in payload
 
-    # Ajoute les credentials simulés
-    payload["email"] = "dummy@example.com"
-    payload["password"] = "dummy123"
+        # Ajoute les credentials simulés
+        payload["email"] = "dummy@example.com"
+        payload["password"] = "dummy123"
 
-    # Vérifie que les champs utilisateurs sont bien ajoutés
-    assert payload["email"] == "dummy@example.com"
-    assert payload["password"] == "dummy123"
+        # Vérifie que les champs utilisateurs sont bien ajoutés
+        assert payload["email"] == "dummy@example.com"
+        assert payload["password"] == "dummy123"